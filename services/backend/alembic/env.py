@@ -30,6 +30,23 @@ config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URL))
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Postgres-only generated columns (and their GIN indexes) added by migration
+# e2a4c6b8d0f3; the models leave them out so SQLite can build the schema too
+SEARCH_VECTOR = "search_vector"
+
+
+def include_object(
+    obj: object, name: str | None, type_: str, reflected: bool, compare_to: object | None
+) -> bool:
+    """Keep autogenerate from dropping the search vectors that only the database has."""
+    if reflected and compare_to is None and name:
+        if type_ == "column" and name == SEARCH_VECTOR:
+            return False
+        if type_ == "index" and name.endswith(f"_{SEARCH_VECTOR}"):
+            return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -52,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,7 +80,9 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,37 @@
+"""add indexes for profile list queries
+
+Revision ID: b3f1c2d4e5a6
+Revises: seed_profile_content_002
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1c2d4e5a6"
+down_revision: str | None = "seed_profile_content_002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_work_experiences_start_date_id", "work_experiences", ["start_date", "id"])
+    op.create_index(
+        "ix_projects_is_featured_start_date_id", "projects", ["is_featured", "start_date", "id"]
+    )
+    op.create_index("ix_testimonials_date_id", "testimonials", ["date", "id"])
+    op.create_index("ix_contacts_is_visible_sort_order", "contacts", ["is_visible", "sort_order"])
+    op.create_index("ix_resumes_is_active_language_code", "resumes", ["is_active", "language_code"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_resumes_is_active_language_code", table_name="resumes")
+    op.drop_index("ix_contacts_is_visible_sort_order", table_name="contacts")
+    op.drop_index("ix_testimonials_date_id", table_name="testimonials")
+    op.drop_index("ix_projects_is_featured_start_date_id", table_name="projects")
+    op.drop_index("ix_work_experiences_start_date_id", table_name="work_experiences")
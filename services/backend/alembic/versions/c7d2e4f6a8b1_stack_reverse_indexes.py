@@ -0,0 +1,29 @@
+"""add reverse indexes on stack association tables
+
+Revision ID: c7d2e4f6a8b1
+Revises: b3f1c2d4e5a6
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2e4f6a8b1"
+down_revision: str | None = "b3f1c2d4e5a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_project_stacks_stack_id", "project_stacks", ["stack_id"])
+    op.create_index("ix_work_experience_stacks_stack_id", "work_experience_stacks", ["stack_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_work_experience_stacks_stack_id", table_name="work_experience_stacks")
+    op.drop_index("ix_project_stacks_stack_id", table_name="project_stacks")
@@ -0,0 +1,65 @@
+"""add precomputed stack usage
+
+Revision ID: d9e1f3a5b7c2
+Revises: c7d2e4f6a8b1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e1f3a5b7c2"
+down_revision: str | None = "c7d2e4f6a8b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "stack_usage",
+        sa.Column("stack_id", sa.Uuid(), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.Column("experience_count", sa.Integer(), nullable=False),
+        sa.Column("first_used", sa.Date(), nullable=True),
+        sa.Column("last_used", sa.Date(), nullable=True),
+        sa.Column("in_use", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["stack_id"], ["stacks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("stack_id"),
+    )
+    # Backfill; afterwards the rows are maintained on flush by the application
+    op.execute(
+        """
+        INSERT INTO stack_usage
+            (stack_id, project_count, experience_count, first_used, last_used, in_use)
+        SELECT
+            s.id,
+            COUNT(CASE WHEN e.kind = 'project' THEN 1 END),
+            COUNT(CASE WHEN e.kind = 'experience' THEN 1 END),
+            MIN(e.start_date),
+            MAX(e.end_date),
+            COALESCE(MAX(CASE WHEN e.ongoing THEN 1 ELSE 0 END), 0) = 1
+        FROM stacks s
+        LEFT JOIN (
+            SELECT ps.stack_id, 'project' AS kind, p.start_date,
+                   COALESCE(p.end_date, p.start_date) AS end_date,
+                   p.end_date IS NULL AS ongoing
+            FROM project_stacks ps JOIN projects p ON p.id = ps.project_id
+            UNION ALL
+            SELECT ws.stack_id, 'experience', w.start_date,
+                   COALESCE(w.end_date, w.start_date), w.is_current
+            FROM work_experience_stacks ws JOIN work_experiences w ON w.id = ws.work_experience_id
+        ) e ON e.stack_id = s.id
+        GROUP BY s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stack_usage")
@@ -0,0 +1,60 @@
+"""add full-text search vectors to translations
+
+Revision ID: e2a4c6b8d0f3
+Revises: d9e1f3a5b7c2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a4c6b8d0f3"
+down_revision: str | None = "d9e1f3a5b7c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.services.search.TEXT_SEARCH_CONFIGS
+_CONFIG = "CASE language_code WHEN 'ru' THEN 'russian'::regconfig ELSE 'english'::regconfig END"
+
+# table -> searchable text columns, most important first;
+# must match app.services.search.SEARCHABLE, which the in-memory index is built from
+SEARCHABLE = {
+    "project_translations": ("title", "description", "role"),
+    "work_experience_translations": ("position", "description", "location"),
+    "testimonial_translations": ("content", "author_position"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # Other databases use the in-memory index of app.services.search
+        return
+    for table, columns in SEARCHABLE.items():
+        weights = "ABCD"
+        vector = " || ".join(
+            f"setweight(to_tsvector({_CONFIG}, coalesce({column}, '')), '{weights[i]}')"
+            for i, column in enumerate(columns)
+        )
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({vector}) STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in SEARCHABLE:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -1,9 +1,15 @@
-"""Health check endpoint."""
+"""Health check endpoints."""
 
-from fastapi import APIRouter
+from typing import Any, Literal
+
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 
+from app.api.v1.profile import profile_cache
 from app.config import settings
+from app.core.pool import pool_status
+from app.database import monitored_engines
+from app.services.health import CheckResult, check_readiness
 
 router = APIRouter()
 
@@ -17,6 +23,25 @@ class HealthResponse(BaseModel):
     project_name: str
 
 
+class LivenessResponse(BaseModel):
+    """Liveness response model."""
+
+    status: Literal["ok"]
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness response model with the result of every check."""
+
+    status: Literal["ready", "not_ready"]
+    checks: dict[str, CheckResult]
+
+
+class PoolStatusResponse(BaseModel):
+    """Connection pool occupancy and cumulative metrics by engine."""
+
+    pools: dict[str, dict[str, Any]]
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
@@ -26,3 +51,39 @@ async def health_check() -> HealthResponse:
         environment=settings.ENVIRONMENT,
         project_name=settings.PROJECT_NAME,
     )
+
+
+@router.get("/health/live", response_model=LivenessResponse)
+async def liveness() -> LivenessResponse:
+    """The process is up and serving requests; touches no dependencies."""
+    return LivenessResponse(status="ok")
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Not ready"}},
+)
+async def readiness(request: Request, response: Response) -> ReadinessResponse:
+    """
+    Whether this worker should receive traffic: its pools have free connections,
+    the profile caches finished their warm-up and the database is at the migration head.
+    Cache entries evicted after the warm-up are rewarmed in the background and do not
+    fail the check. Responds 503 when any check fails.
+    """
+    checks = await check_readiness(request.app, profile_cache)
+    ready = all(check.ok for check in checks.values())
+    if not ready:
+        response.status_code = 503
+    return ReadinessResponse(status="ready" if ready else "not_ready", checks=checks)
+
+
+@router.get("/health/pool", response_model=PoolStatusResponse)
+async def pool_health() -> PoolStatusResponse:
+    """
+    Pool occupancy (checked out, idle, overflow in use) and metrics since startup:
+    checkout and wait times, peak overflow, timeouts, recycled connections.
+    """
+    return PoolStatusResponse(
+        pools={name: pool_status(engine) for name, engine in monitored_engines().items()}
+    )
@@ -1,217 +1,586 @@
-from collections.abc import Sequence
-from typing import Any
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Generic, Literal, TypeVar
 
-from fastapi import APIRouter, Depends, Query, Response
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import get_db
+from app.config import settings
+from app.core.cache import SnapshotCache
+from app.core.compression import compress_variants, negotiate_encoding
+from app.core.conditional import (
+    Validators,
+    change_clock,
+    is_not_modified,
+    latest_timestamp,
+    make_etag,
+)
+from app.core.pagination import InvalidCursorError, Keyset
+from app.core.projection import UnknownFieldError, parse_fields, partial_schema, projection_options
+from app.core.security import require_admin
+from app.database import get_db, get_read_db, get_read_session_factory
 from app.models.contact import Contact
-from app.models.project import Project
+from app.models.project import Project, project_stacks
 from app.models.resume import Resume
-from app.models.stack import Stack
+from app.models.stack import Stack, StackUsage
 from app.models.testimonial import Testimonial
-from app.models.work_experience import WorkExperience
+from app.models.work_experience import WorkExperience, work_experience_stacks
+from app.schemas.exchange import ImportSummary
 from app.schemas.profile import (
     ContactRead,
-    LocalizedContactRead,
     LocalizedProjectRead,
-    LocalizedTestimonialRead,
-    LocalizedWorkExperienceRead,
     ProfileFullRead,
     ProjectRead,
     ResumeRead,
+    StackEntriesRead,
     StackRead,
+    StackUsageRead,
     TestimonialRead,
     WorkExperienceRead,
 )
+from app.services.exchange import ImportValidationError, export_ndjson, import_ndjson
+from app.services.profile import (
+    StackInterner,
+    compact_profile,
+    content_tables,
+    latest_modification,
+    load_full_profile,
+    modified_at,
+    serialize_project,
+    serialize_work_experience,
+    with_preferred_translation,
+)
 
 router = APIRouter(prefix="/profile", tags=["Profile"])
 
 # Cache duration for profile data (1 hour)
 PROFILE_CACHE_MAX_AGE = 3600
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot(Generic[T]):
+    """Validated payload, its encoded JSON body, precompressed variants and HTTP validators."""
+
+    payload: T
+    body: bytes
+    validators: Validators
+    next_cursor: str | None = None
+    # Filled in only for snapshots that are cached
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_body(
+        cls,
+        payload: T,
+        body: bytes,
+        last_modified: datetime | None,
+        next_cursor: str | None = None,
+    ) -> "ProfileSnapshot[T]":
+        return cls(
+            payload=payload,
+            body=body,
+            validators=Validators(etag=make_etag(body), last_modified=last_modified),
+            next_cursor=next_cursor,
+        )
+
+
+# Keyset pagination sort keys; the last column of each is unique
+WORK_EXPERIENCE_ORDER = Keyset((WorkExperience.start_date, WorkExperience.id), descending=True)
+PROJECT_ORDER = Keyset((Project.is_featured, Project.start_date, Project.id), descending=True)
+STACK_ORDER = Keyset((Stack.name,))
+TESTIMONIAL_ORDER = Keyset((Testimonial.date, Testimonial.id), descending=True)
+
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class ListParams:
+    """Pagination and field selection of a list endpoint."""
+
+    limit: int | None
+    cursor: str | None
+    fields: str | None
+
+
+def list_params(
+    limit: int | None = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get every entry"
+    ),
+    cursor: str | None = Query(
+        None, description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to include, e.g. id,slug,stacks"
+    ),
+) -> ListParams:
+    return ListParams(limit=limit, cursor=cursor, fields=fields)
+
+
+# Materialized payloads keyed by (endpoint, *parameters)
+profile_cache: SnapshotCache[ProfileSnapshot[Any]] = SnapshotCache(
+    ttl=settings.PROFILE_CACHE_TTL, max_entries=256
+)
+
 
 @router.get("/experience", response_model=list[WorkExperienceRead])
 async def get_work_experience(
-    response: Response, db: AsyncSession = Depends(get_db)
-) -> Sequence[WorkExperience]:
+    request: Request,
+    lang: str | None = Query(
+        None,
+        min_length=2,
+        max_length=5,
+        description="Only include the translation for this language (falls back to en, then first)",
+    ),
+    page: ListParams = Depends(list_params),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
-    Get all work experience entries with translations and stacks.
+    Get work experience entries with translations and stacks, newest first.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(select(WorkExperience).order_by(WorkExperience.start_date.desc()))
-    return result.scalars().all()
+    return await _serve_list(
+        request,
+        db,
+        "experience",
+        select(WorkExperience),
+        WorkExperienceRead,
+        WORK_EXPERIENCE_ORDER,
+        page,
+        lang,
+    )
 
 
 @router.get("/projects", response_model=list[ProjectRead])
-async def get_projects(response: Response, db: AsyncSession = Depends(get_db)) -> Sequence[Project]:
+async def get_projects(
+    request: Request,
+    lang: str | None = Query(
+        None,
+        min_length=2,
+        max_length=5,
+        description="Only include the translation for this language (falls back to en, then first)",
+    ),
+    page: ListParams = Depends(list_params),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
-    Get all projects with translations and stacks.
+    Get projects with translations and stacks, featured first.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(
-        select(Project).order_by(Project.is_featured.desc(), Project.start_date.desc())
+    return await _serve_list(
+        request, db, "projects", select(Project), ProjectRead, PROJECT_ORDER, page, lang
+    )
+
+
+@router.get("/projects/{slug}", response_model=LocalizedProjectRead)
+async def get_project(
+    request: Request,
+    slug: str,
+    lang: str = Query("en", min_length=2, max_length=5, description="Language code, e.g. en or ru"),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    """
+    Get a single localized project by slug.
+    Translations fall back to English, then to the first available translation.
+    """
+    return await _serve(
+        request,
+        ("project", slug, lang),
+        lambda: _build_project(db, slug, lang),
+        _is_published(lang),
     )
-    return result.scalars().all()
 
 
 @router.get("/stacks", response_model=list[StackRead])
-async def get_stacks(response: Response, db: AsyncSession = Depends(get_db)) -> Sequence[Stack]:
+async def get_stacks(
+    request: Request,
+    page: ListParams = Depends(list_params),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    """
+    Get tech stacks ordered by name.
+    """
+    return await _serve_list(
+        request, db, "stacks", select(Stack), StackRead, STACK_ORDER, page, None
+    )
+
+
+@router.get("/stacks/{name}", response_model=StackEntriesRead)
+async def get_stack_entries(
+    request: Request,
+    name: str,
+    lang: str = Query("en", min_length=2, max_length=5, description="Language code, e.g. en or ru"),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
-    Get all tech stacks.
+    Get the localized work experience and projects built with a stack,
+    with its precomputed usage counts and date span.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(select(Stack).order_by(Stack.name))
-    return result.scalars().all()
+    return await _serve(
+        request,
+        ("stack", name, lang),
+        lambda: _build_stack_entries(db, name, lang),
+        _is_published(lang),
+    )
 
 
 @router.get("/testimonials", response_model=list[TestimonialRead])
 async def get_testimonials(
-    response: Response, db: AsyncSession = Depends(get_db)
-) -> Sequence[Testimonial]:
+    request: Request,
+    lang: str | None = Query(
+        None,
+        min_length=2,
+        max_length=5,
+        description="Only include the translation for this language (falls back to en, then first)",
+    ),
+    page: ListParams = Depends(list_params),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
-    Get all testimonials with translations.
+    Get testimonials with translations, newest first.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(select(Testimonial).order_by(Testimonial.date.desc()))
-    return result.scalars().all()
+    return await _serve_list(
+        request,
+        db,
+        "testimonials",
+        select(Testimonial),
+        TestimonialRead,
+        TESTIMONIAL_ORDER,
+        page,
+        lang,
+    )
 
 
 @router.get("/contacts", response_model=list[ContactRead])
-async def get_contacts(response: Response, db: AsyncSession = Depends(get_db)) -> Sequence[Contact]:
+async def get_contacts(
+    request: Request,
+    lang: str | None = Query(
+        None,
+        min_length=2,
+        max_length=5,
+        description="Only include the translation for this language (falls back to en, then first)",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
     Get all visible contacts with translations.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(
-        select(Contact).where(Contact.is_visible).order_by(Contact.sort_order)
+    statement = select(Contact).where(Contact.is_visible).order_by(Contact.sort_order)
+    if lang:
+        statement = with_preferred_translation(statement, Contact.translations, lang)
+    return await _serve(
+        request,
+        ("contacts", lang),
+        lambda: _build_list(db, statement, _CONTACT_LIST),
+        _is_published(lang),
     )
-    return result.scalars().all()
 
 
 @router.get("/resume", response_model=list[ResumeRead])
-async def get_resume(response: Response, db: AsyncSession = Depends(get_db)) -> Sequence[Resume]:
+async def get_resume(request: Request, db: AsyncSession = Depends(get_read_db)) -> Response:
     """
     Get active resumes.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    result = await db.execute(select(Resume).where(Resume.is_active))
-    return result.scalars().all()
+    statement = select(Resume).where(Resume.is_active).order_by(Resume.language_code)
+    return await _serve(request, ("resume",), lambda: _build_list(db, statement, _RESUME_LIST))
 
 
 @router.get("/full", response_model=ProfileFullRead)
 async def get_full_profile(
-    response: Response,
+    request: Request,
     lang: str = Query("en", min_length=2, max_length=5, description="Language code, e.g. en or ru"),
-    db: AsyncSession = Depends(get_db),
-) -> ProfileFullRead:
+    response_format: Literal["full", "compact"] = Query(
+        "full",
+        alias="format",
+        description="compact: stacks sent once and referenced by index, null fields omitted",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+) -> Response:
     """
     Aggregate profile data for a specific language.
     Translations fall back to English, then to the first available translation.
+    Served from an in-memory snapshot that is rebuilt after content changes.
     """
-    response.headers["Cache-Control"] = f"public, max-age={PROFILE_CACHE_MAX_AGE}"
-    work_experiences_result = await db.execute(
-        select(WorkExperience).order_by(WorkExperience.start_date.desc())
-    )
-    projects_result = await db.execute(
-        select(Project).order_by(Project.is_featured.desc(), Project.start_date.desc())
-    )
-    stacks_result = await db.execute(select(Stack).order_by(Stack.name))
-    testimonials_result = await db.execute(select(Testimonial).order_by(Testimonial.date.desc()))
-    contacts_result = await db.execute(
-        select(Contact).where(Contact.is_visible).order_by(Contact.sort_order)
-    )
-    resumes_result = await db.execute(
-        select(Resume).where(Resume.is_active).order_by(Resume.language_code)
-    )
-
-    work_experiences = [
-        _serialize_work_experience(entry, lang) for entry in work_experiences_result.scalars().all()
-    ]
-    projects = [_serialize_project(entry, lang) for entry in projects_result.scalars().all()]
-    stacks = [StackRead.model_validate(entry) for entry in stacks_result.scalars().all()]
-    testimonials = [
-        _serialize_testimonial(entry, lang) for entry in testimonials_result.scalars().all()
-    ]
-    contacts = [_serialize_contact(entry, lang) for entry in contacts_result.scalars().all()]
-    resumes = [ResumeRead.model_validate(entry) for entry in resumes_result.scalars().all()]
-
-    return ProfileFullRead(
-        experience=work_experiences,
-        projects=projects,
-        stacks=stacks,
-        testimonials=testimonials,
-        contacts=contacts,
-        resumes=resumes,
-    )
-
-
-def _pick_translation(translations: Sequence[Any], lang: str) -> Any | None:
-    """Pick translation by lang -> en -> first."""
-    for translation in translations:
-        if translation.language_code == lang:
-            return translation
-    for translation in translations:
-        if translation.language_code == "en":
-            return translation
-    return translations[0] if translations else None
-
-
-def _serialize_work_experience(entry: WorkExperience, lang: str) -> LocalizedWorkExperienceRead:
-    translation = _pick_translation(entry.translations, lang)
-    return LocalizedWorkExperienceRead(
-        id=entry.id,
-        company_name=entry.company_name,
-        company_url=entry.company_url,
-        start_date=entry.start_date,
-        end_date=entry.end_date,
-        is_current=entry.is_current,
-        position=translation.position if translation else "",
-        description=translation.description if translation else "",
-        location=translation.location if translation else None,
-        stacks=[StackRead.model_validate(stack) for stack in entry.stacks],
-    )
-
-
-def _serialize_project(entry: Project, lang: str) -> LocalizedProjectRead:
-    translation = _pick_translation(entry.translations, lang)
-    return LocalizedProjectRead(
-        id=entry.id,
-        slug=entry.slug,
-        link=entry.link,
-        repo_link=entry.repo_link,
-        start_date=entry.start_date,
-        end_date=entry.end_date,
-        is_featured=entry.is_featured,
-        title=translation.title if translation else "",
-        description=translation.description if translation else "",
-        role=translation.role if translation else None,
-        stacks=[StackRead.model_validate(stack) for stack in entry.stacks],
-    )
-
-
-def _serialize_testimonial(entry: Testimonial, lang: str) -> LocalizedTestimonialRead:
-    translation = _pick_translation(entry.translations, lang)
-    return LocalizedTestimonialRead(
-        id=entry.id,
-        author_name=entry.author_name,
-        author_url=entry.author_url,
-        author_avatar_url=entry.author_avatar_url,
-        kind=entry.kind,
-        date=entry.date,
-        author_position=translation.author_position if translation else None,
-        content=translation.content if translation else "",
-    )
-
-
-def _serialize_contact(entry: Contact, lang: str) -> LocalizedContactRead:
-    translation = _pick_translation(entry.translations, lang)
-    return LocalizedContactRead(
-        id=entry.id,
-        type=entry.type,
-        value=entry.value,
-        icon=entry.icon,
-        sort_order=entry.sort_order,
-        label=translation.label if translation else None,
+
+    def build_full() -> Awaitable[ProfileSnapshot[ProfileFullRead]]:
+        return _build_full_profile(db, session_factory, lang)
+
+    if response_format == "compact":
+        return await _serve(
+            request,
+            ("full", lang, "compact"),
+            lambda: _build_compact_profile(lang, build_full),
+            _is_published(lang),
+        )
+    return await _serve(request, ("full", lang), build_full, _is_published(lang))
+
+
+@router.get(
+    "/export.ndjson",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_admin)],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_profile(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+) -> StreamingResponse:
+    """
+    Stream every profile entity with its translations and stacks as NDJSON (admin only).
+    The export reads through its own session, which lives as long as the stream.
+    """
+    filename = f"profile-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.ndjson"
+    return StreamingResponse(
+        export_ndjson(session_factory),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-store",
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
     )
+
+
+@router.post(
+    "/import",
+    response_model=ImportSummary,
+    dependencies=[Depends(require_admin)],
+    openapi_extra={"requestBody": {"content": {"application/x-ndjson": {}}}},
+)
+async def import_profile(request: Request, db: AsyncSession = Depends(get_db)) -> ImportSummary:
+    """
+    Upsert NDJSON in the export format (admin only). Lines are validated as the
+    body streams in; any invalid line rolls back the whole import.
+    """
+    try:
+        imported = await import_ndjson(db, request.stream())
+    except ImportValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ImportSummary(imported=imported)
+
+
+def _is_published(lang: str | None) -> bool:
+    """Languages the site is published in; other language codes are not cached."""
+    return lang is None or lang in settings.PROFILE_LANGUAGES
+
+
+async def _cached(
+    key: Hashable, build: Callable[[], Awaitable[ProfileSnapshot[T]]]
+) -> ProfileSnapshot[T]:
+    """Get or build a cached snapshot, precompressed off the event loop."""
+
+    async def build_precompressed() -> ProfileSnapshot[T]:
+        snapshot = await build()
+        encoded = await asyncio.to_thread(compress_variants, snapshot.body)
+        return replace(snapshot, encoded=encoded)
+
+    return await profile_cache.get_or_build(key, build_precompressed)
+
+
+async def _serve(
+    request: Request,
+    key: Hashable,
+    build: Callable[[], Awaitable[ProfileSnapshot[Any]]],
+    cacheable: bool = True,
+) -> Response:
+    """
+    Serve a cached snapshot, answering conditional requests with 304.
+    The pre-encoded body is returned as is, bypassing response_model validation,
+    in the best precompressed coding the client accepts.
+    Snapshots that are not cacheable (unpublished languages, pages, projections)
+    are built per request and sent uncompressed, so arbitrary query strings can
+    neither evict the shared entries nor cost a compression pass each.
+    """
+    snapshot = await _cached(key, build) if cacheable else await build()
+    coding = negotiate_encoding(request.headers.get("accept-encoding"), tuple(snapshot.encoded))
+    validators = snapshot.validators.for_encoding(coding)
+    headers = {
+        "Cache-Control": f"public, max-age={PROFILE_CACHE_MAX_AGE}",
+        "Vary": "Accept-Encoding",
+        **validators.headers(),
+    }
+    if snapshot.next_cursor is not None:
+        headers["X-Next-Cursor"] = snapshot.next_cursor
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=headers)
+    if coding is None:
+        return Response(content=snapshot.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = coding
+    return Response(
+        content=snapshot.encoded[coding], media_type="application/json", headers=headers
+    )
+
+
+_CONTACT_LIST: TypeAdapter[list[ContactRead]] = TypeAdapter(list[ContactRead])
+_RESUME_LIST: TypeAdapter[list[ResumeRead]] = TypeAdapter(list[ResumeRead])
+
+
+async def _serve_list(
+    request: Request,
+    db: AsyncSession,
+    name: str,
+    statement: Select[Any],
+    schema: type[BaseModel],
+    keyset: Keyset,
+    page: ListParams,
+    lang: str | None,
+) -> Response:
+    """
+    Serve a page of a list endpoint.
+    With `fields`, only the requested columns are loaded and unrequested relationships
+    are not eager-loaded; with `lang`, only the preferred translation is.
+    """
+    model = statement.column_descriptions[0]["entity"]
+    try:
+        fields = parse_fields(page.fields, schema)
+        statement = keyset.paginate(statement, page.cursor, page.limit)
+    except (InvalidCursorError, UnknownFieldError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if fields is not None:
+        required = (*keyset.columns, model.updated_at)
+        statement = statement.options(*projection_options(model, fields, required))
+        schema = partial_schema(schema, fields)
+    if lang and (fields is None or "translations" in fields):
+        statement = with_preferred_translation(statement, model.translations, lang)
+
+    adapter = _list_adapter(schema)
+    key = (name, lang, page.limit, page.cursor, fields)
+    cacheable = _is_published(lang) and page == ListParams(None, None, None)
+    return await _serve(
+        request, key, lambda: _build_list(db, statement, adapter, keyset, page.limit), cacheable
+    )
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+async def _build_list(
+    db: AsyncSession,
+    statement: Select[Any],
+    adapter: TypeAdapter[list[T]],
+    keyset: Keyset | None = None,
+    limit: int | None = None,
+) -> ProfileSnapshot[list[T]]:
+    """Load rows and validate them into a snapshot of the list response."""
+    result = await db.execute(statement)
+    rows: Sequence[Any] = result.scalars().all()
+    next_cursor = None
+    if keyset is not None:
+        rows, next_cursor = keyset.page(rows, limit)
+    payload = adapter.validate_python(rows, from_attributes=True)
+    tables = content_tables(statement.column_descriptions[0]["entity"])
+    return ProfileSnapshot.from_body(
+        payload,
+        adapter.dump_json(payload),
+        await _last_modified(db, rows, tables),
+        next_cursor,
+    )
+
+
+async def _last_modified(
+    db: AsyncSession, rows: Iterable[Any], tables: frozenset[str]
+) -> datetime | None:
+    """
+    Latest modification of the rows, or of their tables as recorded by the change clock,
+    which covers rows that were deleted or no longer match the query.
+    """
+    await _seed_change_clock(db)
+    return latest_timestamp((*map(modified_at, rows), change_clock.last_changed(tables)))
+
+
+async def _seed_change_clock(db: AsyncSession) -> None:
+    """
+    Seed the change clock from the data on the first build rather than with the
+    process start, so every worker and restart reports the same Last-Modified.
+    """
+    if not change_clock.seeded:
+        change_clock.seed(await latest_modification(db))
+
+
+async def _build_project(
+    db: AsyncSession, slug: str, lang: str
+) -> ProfileSnapshot[LocalizedProjectRead]:
+    """Look a project up through the unique slug index and localize it."""
+    result = await db.execute(select(Project).where(Project.slug == slug))
+    project = result.scalar_one_or_none()
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    payload = serialize_project(project, lang)
+    return ProfileSnapshot.from_body(
+        payload,
+        payload.model_dump_json().encode(),
+        await _last_modified(db, [project], content_tables(Project)),
+    )
+
+
+async def _build_stack_entries(
+    db: AsyncSession, name: str, lang: str
+) -> ProfileSnapshot[StackEntriesRead]:
+    """Collect entries using a stack through the reverse stack_id indexes."""
+    result = await db.execute(select(Stack).where(Stack.name == name))
+    stack = result.scalar_one_or_none()
+    if stack is None:
+        raise HTTPException(status_code=404, detail="Stack not found")
+
+    experience_statement = WORK_EXPERIENCE_ORDER.paginate(
+        select(WorkExperience)
+        .join(
+            work_experience_stacks,
+            work_experience_stacks.c.work_experience_id == WorkExperience.id,
+        )
+        .where(work_experience_stacks.c.stack_id == stack.id),
+        None,
+        None,
+    )
+    project_statement = PROJECT_ORDER.paginate(
+        select(Project)
+        .join(project_stacks, project_stacks.c.project_id == Project.id)
+        .where(project_stacks.c.stack_id == stack.id),
+        None,
+        None,
+    )
+    usage = await db.get(StackUsage, stack.id)
+    experience_rows = (await db.execute(experience_statement)).scalars().all()
+    project_rows = (await db.execute(project_statement)).scalars().all()
+
+    stacks = StackInterner()
+    payload = StackEntriesRead(
+        stack=stacks(stack),
+        usage=StackUsageRead.model_validate(usage) if usage else StackUsageRead(),
+        experience=[serialize_work_experience(row, lang, stacks) for row in experience_rows],
+        projects=[serialize_project(row, lang, stacks) for row in project_rows],
+    )
+    rows = (stack, *experience_rows, *project_rows)
+    return ProfileSnapshot.from_body(
+        payload,
+        payload.model_dump_json().encode(),
+        await _last_modified(db, rows, content_tables(Stack, StackUsage, WorkExperience, Project)),
+    )
+
+
+async def _build_full_profile(
+    db: AsyncSession, session_factory: async_sessionmaker[AsyncSession], lang: str
+) -> ProfileSnapshot[ProfileFullRead]:
+    """Load the localized profile with the configured loader."""
+    profile, last_modified = await load_full_profile(db, session_factory, lang)
+    # The full profile is built from every table
+    await _seed_change_clock(db)
+    last_modified = latest_timestamp((last_modified, change_clock.last_changed()))
+    return ProfileSnapshot.from_body(profile, profile.model_dump_json().encode(), last_modified)
+
+
+async def _build_compact_profile(
+    lang: str, build_full: Callable[[], Awaitable[ProfileSnapshot[ProfileFullRead]]]
+) -> ProfileSnapshot[dict[str, Any]]:
+    """Derive the compact variant from the (cached) full snapshot without reloading."""
+    full = await (_cached(("full", lang), build_full) if _is_published(lang) else build_full())
+    payload = compact_profile(full.payload)
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    return ProfileSnapshot.from_body(payload, body, full.validators.last_modified)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_read_db
+from app.schemas.search import SearchResults
+from app.services.search import search_profile
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+MAX_SEARCH_RESULTS = 50
+
+
+@router.get("", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    lang: str = Query("en", min_length=2, max_length=5, description="Language code, e.g. en or ru"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    db: AsyncSession = Depends(get_read_db),
+) -> SearchResults:
+    """
+    Search projects, work experience and testimonials in one language.
+    Hits are ranked by relevance; matched words in the snippet are wrapped in <mark>.
+    """
+    hits = await search_profile(db, q, lang, limit)
+    return SearchResults(query=q, lang=lang, hits=hits)
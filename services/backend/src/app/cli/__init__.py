@@ -0,0 +1 @@
+"""Command line entry points (`python -m app.cli.<command>`)."""
@@ -0,0 +1,168 @@
+"""Export per-language profile snapshots for build-time consumption by the site.
+
+Usage:
+    python -m app.cli.export_snapshots --out ../frontend/src/data/snapshots
+
+Layout (the version directory changes only when the file format does):
+    <out>/v1/manifest.json               content hash of every file below
+    <out>/v1/<lang>/profile.json         ProfileFullRead
+    <out>/v1/<lang>/projects/<slug>.json LocalizedProjectRead
+
+Files are rewritten only when their content hash changed, and files that are
+no longer produced (e.g. a deleted project) are removed. Only the exported
+languages are touched: `--lang en` keeps the files of the other languages and
+their manifest entries as they are.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.schemas.profile import ProfileFullRead
+from app.services.profile import load_full_profile
+
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class ExportResult:
+    """Relative paths of snapshot files by outcome."""
+
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def render_snapshots(profiles: dict[str, ProfileFullRead]) -> dict[str, bytes]:
+    """Encode profiles into snapshot files keyed by path relative to the version directory."""
+    files: dict[str, bytes] = {}
+    for lang, profile in profiles.items():
+        files[f"{lang}/profile.json"] = _encode(profile)
+        for project in profile.projects:
+            if Path(project.slug).name != project.slug or project.slug in {".", ".."}:
+                raise ValueError(f"Project slug {project.slug!r} is not a valid file name")
+            files[f"{lang}/projects/{project.slug}.json"] = _encode(project)
+    return files
+
+
+def write_snapshots(
+    out_dir: Path, files: dict[str, bytes], languages: Collection[str] | None = None
+) -> ExportResult:
+    """
+    Write changed files, prune stale ones and update the manifest.
+    With `languages`, only files under those languages are pruned; the other entries are kept.
+    """
+    version_dir = out_dir / f"v{SNAPSHOT_VERSION}"
+    manifest_path = version_dir / MANIFEST_NAME
+    previous: dict[str, str] = {}
+    kept: dict[str, str] = {}
+    for relative, digest in _read_manifest(manifest_path).items():
+        outside = languages is not None and relative.split("/", 1)[0] not in languages
+        (kept if outside else previous)[relative] = digest
+    result = ExportResult()
+
+    hashes: dict[str, str] = {}
+    for relative, content in sorted(files.items()):
+        digest = hashlib.sha256(content).hexdigest()
+        hashes[relative] = digest
+        path = version_dir / relative
+        if previous.get(relative) == digest and path.exists():
+            result.unchanged.append(relative)
+            continue
+        _write_atomic(path, content)
+        result.written.append(relative)
+
+    for relative in sorted(previous.keys() - hashes.keys()):
+        (version_dir / relative).unlink(missing_ok=True)
+        result.removed.append(relative)
+
+    if result.written or result.removed or not manifest_path.exists():
+        manifest = {"version": SNAPSHOT_VERSION, "files": dict(sorted({**kept, **hashes}.items()))}
+        _write_atomic(manifest_path, _dump(manifest))
+    return result
+
+
+async def export_snapshots(
+    out_dir: Path,
+    languages: Sequence[str],
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> ExportResult:
+    """Load the profile in every language and write the snapshot tree."""
+    profiles: dict[str, ProfileFullRead] = {}
+    async with session_factory() as db:
+        for lang in languages:
+            profiles[lang], _ = await load_full_profile(db, session_factory, lang)
+    return write_snapshots(out_dir, render_snapshots(profiles), languages)
+
+
+def _encode(model: BaseModel) -> bytes:
+    return _dump(model.model_dump(mode="json"))
+
+
+def _dump(document: object) -> bytes:
+    return (json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode()
+
+
+def _read_manifest(path: Path) -> dict[str, str]:
+    try:
+        manifest = json.loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return dict(manifest.get("files", {}))
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+async def _run(out_dir: Path, languages: Sequence[str]) -> ExportResult:
+    try:
+        return await export_snapshots(out_dir, languages)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export per-language profile snapshots.")
+    parser.add_argument("--out", type=Path, required=True, help="Snapshot root directory")
+    parser.add_argument(
+        "--lang",
+        action="append",
+        dest="languages",
+        help="Language to export (repeatable); defaults to PROFILE_LANGUAGES",
+    )
+    args = parser.parse_args(argv)
+    languages = args.languages or settings.PROFILE_LANGUAGES
+
+    result = asyncio.run(_run(args.out, languages))
+    print(
+        f"Snapshots v{SNAPSHOT_VERSION} in {args.out}: {len(result.written)} written, "
+        f"{len(result.unchanged)} unchanged, {len(result.removed)} removed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
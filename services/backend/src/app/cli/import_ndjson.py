@@ -0,0 +1,59 @@
+"""Import profile content from NDJSON in the export format.
+
+Usage:
+    python -m app.cli.import_ndjson profile.ndjson
+    python -m app.cli.import_ndjson - < profile.ndjson
+
+Entities are upserted by their natural keys, so re-importing a file is
+idempotent. Any invalid line rolls back the whole import.
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Sequence
+from typing import BinaryIO
+
+from app.database import AsyncSessionLocal, engine
+from app.services.exchange import IMPORT_BATCH_SIZE, ImportValidationError, import_ndjson
+
+READ_SIZE = 64 * 1024
+
+
+async def _chunks(stream: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(stream.read, READ_SIZE):
+        yield chunk
+
+
+async def _run(stream: BinaryIO, batch_size: int) -> dict[str, int]:
+    try:
+        async with AsyncSessionLocal() as session:
+            return await import_ndjson(session, _chunks(stream), batch_size)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import profile content from NDJSON.")
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    parser.add_argument(
+        "--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Rows per upsert statement"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.path == "-":
+            imported = asyncio.run(_run(sys.stdin.buffer, args.batch_size))
+        else:
+            with open(args.path, "rb") as stream:
+                imported = asyncio.run(_run(stream, args.batch_size))
+    except ImportValidationError as exc:
+        print(f"Import failed, nothing was written: {exc}", file=sys.stderr)
+        return 1
+    summary = ", ".join(f"{count} {entity}" for entity, count in imported.items())
+    print(f"Imported {summary or 'nothing'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,10 @@
 """Application configuration using pydantic-settings."""
 
-from typing import Any
+import json
+from typing import Annotated, Any, Literal
 
 from pydantic import field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,6 +19,29 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Optional read replicas for read-only requests (comma-separated); the primary
+    # serves them when none is set or all are down
+    DATABASE_REPLICA_URLS: Annotated[list[str], NoDecode] = []
+    # Seconds an unreachable replica stays out of rotation
+    DATABASE_REPLICA_COOLDOWN: float = 30.0
+    # Seconds reads stay on the primary after a content change, so rebuilt
+    # snapshots never miss a write the replicas have not replayed yet
+    DATABASE_REPLICA_PRIMARY_WINDOW: float = 10.0
+
+    # Connection pool, per engine and per worker process: a server needs at least
+    # workers * (POOL_SIZE + MAX_OVERFLOW) connections
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    # Seconds a checkout waits for a free connection before failing
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    # Seconds after which a connection is replaced; -1 keeps connections indefinitely
+    DATABASE_POOL_RECYCLE: int = 1800
+    # Seconds between liveness pings of each pool; 0 pings on every checkout instead
+    DATABASE_LIVENESS_INTERVAL: float = 0
+    # Compiled statement cache entries per engine (SQLAlchemy query_cache_size)
+    DATABASE_QUERY_CACHE_SIZE: int = 500
+    # Prepared statements kept per asyncpg connection; 0 disables the cache
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 100
 
     # Project
     PROJECT_NAME: str = "Personal Site API"
@@ -26,20 +50,43 @@ class Settings(BaseSettings):
     # API
     API_V1_STR: str = "/api/v1"
 
+    # Languages the profile is published in
+    PROFILE_LANGUAGES: Annotated[list[str], NoDecode] = ["en", "ru"]
+
+    # Cache
+    # Profile snapshots are invalidated on writes in this process; the TTL bounds
+    # staleness for other workers that did not see the write.
+    PROFILE_CACHE_TTL: int = 300
+    # "aggregate" builds /profile/full in one JSON statement; "orm" loads each
+    # section on its own pooled connection concurrently.
+    PROFILE_FULL_LOADER: Literal["aggregate", "orm"] = "aggregate"
+    # Open the pools and fill the profile caches at startup, before serving traffic
+    PROFILE_WARM_UP: bool = True
+
+    # Seconds a readiness check result that needs the database is reused
+    HEALTH_PROBE_TTL: float = 30.0
+
     # CORS
-    BACKEND_CORS_ORIGINS: list[str] = ["http://localhost", "http://localhost:4321"]
+    BACKEND_CORS_ORIGINS: Annotated[list[str], NoDecode] = [
+        "http://localhost",
+        "http://localhost:4321",
+    ]
 
     # Admin
     ADMIN_USERNAME: str = "admin"
     ADMIN_PASSWORD: str
     ADMIN_SECRET_KEY: str
 
-    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @field_validator(
+        "BACKEND_CORS_ORIGINS", "PROFILE_LANGUAGES", "DATABASE_REPLICA_URLS", mode="before"
+    )
     @classmethod
-    def parse_cors_origins(cls, v: Any) -> list[str]:
-        """Parse CORS origins from string or list."""
+    def parse_comma_separated(cls, v: Any) -> list[str]:
+        """Parse a list setting from a comma-separated string, a JSON array or a list."""
+        if isinstance(v, str) and v.lstrip().startswith("["):
+            v = json.loads(v)
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return [item.strip() for item in v.split(",") if item.strip()]
         if isinstance(v, list):
             return v
         raise ValueError(v)
@@ -0,0 +1,108 @@
+"""In-process snapshot cache for read-mostly API payloads."""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from app.core.events import ContentChanged, subscribe
+
+T = TypeVar("T")
+
+_caches: "weakref.WeakSet[SnapshotCache[Any]]" = weakref.WeakSet()
+
+
+class _KeyLock:
+    """Build lock of one key and the number of callers using it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Per-key cache of materialized payloads.
+    Entries are built once and served from memory until content changes or the TTL expires.
+    Concurrent misses for the same key share a single build.
+    Caches of values that do not derive from profile content pass
+    `invalidate_on_change=False` and expire by TTL only.
+    """
+
+    def __init__(
+        self, ttl: float | None = None, max_entries: int = 32, invalidate_on_change: bool = True
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        # Only keys with a build in flight or waiting have a lock
+        self._locks: dict[Hashable, _KeyLock] = {}
+        self._generation = 0
+        if invalidate_on_change:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> T | None:
+        """Return a fresh cached value or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all entries; builds already in flight will not be stored."""
+        self._entries.clear()
+        self._locks = {}
+        self._generation += 1
+
+    async def get_or_build(self, key: Hashable, build: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, building it at most once per miss."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        key_lock = self._locks.setdefault(key, _KeyLock())
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+                generation = self._generation
+                value = await build()
+                if generation == self._generation:
+                    self.set(key, value)
+                return value
+        finally:
+            key_lock.users -= 1
+            if not key_lock.users and self._locks.get(key) is key_lock:
+                del self._locks[key]
+
+
+def invalidate_all() -> None:
+    """Invalidate every snapshot cache of profile content in this process."""
+    for cache in list(_caches):
+        cache.invalidate()
+
+
+@subscribe
+def _invalidate_on_content_change(change: ContentChanged) -> None:
+    invalidate_all()
@@ -0,0 +1,122 @@
+"""HTTP validators and conditional request evaluation (RFC 9110, section 13)."""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.requests import Request
+
+from app.core.events import ContentChanged, subscribe
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Strong ETag and optional Last-Modified for a representation."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def for_encoding(self, coding: str | None) -> "Validators":
+        """Validators of a content-coded variant, which needs its own strong ETag."""
+        if coding is None:
+            return self
+        return replace(self, etag=f'{self.etag[:-1]}-{coding}"')
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the representation bytes."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def latest_timestamp(timestamps: Iterable[datetime | None]) -> datetime | None:
+    """Most recent timestamp in UTC, truncated to HTTP-date precision."""
+    values = [
+        (ts if ts.tzinfo else ts.replace(tzinfo=UTC)).astimezone(UTC).replace(microsecond=0)
+        for ts in timestamps
+        if ts is not None
+    ]
+    return max(values, default=None)
+
+
+class ChangeClock:
+    """
+    Last time each table changed, as seen by this process.
+    Row timestamps cannot express deleted or filtered-out rows, so Last-Modified derived
+    from them alone could move backwards; taking the clock into account keeps it monotonic.
+    Changes made before the clock was seeded are unknown, so they count as made at the
+    latest modification found in the data, which every worker reading it agrees on.
+    """
+
+    def __init__(self) -> None:
+        self._seeded = False
+        self._seeded_at: datetime | None = None
+        self._changed_at: dict[str, datetime] = {}
+        # Changes of unknown scope affect every table
+        self._any_changed_at: datetime | None = None
+
+    @property
+    def seeded(self) -> bool:
+        return self._seeded
+
+    def seed(self, at: datetime | None) -> None:
+        """Count earlier changes as made at `at`, the latest modification in the data."""
+        self._seeded = True
+        self._seeded_at = at
+
+    def record(self, tables: Iterable[str], at: datetime) -> None:
+        """Record a change of `tables`; an empty set means any table may have changed."""
+        tables = set(tables)
+        if not tables:
+            self._any_changed_at = at
+        for table in tables:
+            self._changed_at[table] = at
+
+    def last_changed(self, tables: Iterable[str] | None = None) -> datetime | None:
+        """Most recent change to any of `tables`, or to any table at all when None."""
+        changed = self._changed_at.values() if tables is None else map(self._changed_at.get, tables)
+        return latest_timestamp((self._seeded_at, self._any_changed_at, *changed))
+
+    def clear(self) -> None:
+        """Forget every recorded change and the seed."""
+        self._seeded = False
+        self._seeded_at = None
+        self._changed_at.clear()
+        self._any_changed_at = None
+
+
+change_clock = ChangeClock()
+
+
+@subscribe
+def _record_content_change(change: ContentChanged) -> None:
+    change_clock.record(change.tables, datetime.now(UTC))
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since for a GET request.
+    If-None-Match takes precedence; If-Modified-Since is only consulted without it.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or validators.etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return validators.last_modified <= since
@@ -0,0 +1,69 @@
+"""In-process "content changed" events for caches and precomputed snapshots."""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, UOWTransaction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ContentChanged:
+    """
+    Published after profile content was written.
+    An empty `tables` set means the scope of the change is unknown.
+    """
+
+    source: str
+    tables: frozenset[str] = field(default_factory=frozenset)
+
+
+ContentChangedHandler = Callable[[ContentChanged], None]
+
+_subscribers: list[ContentChangedHandler] = []
+
+
+def subscribe(handler: ContentChangedHandler) -> ContentChangedHandler:
+    """Register a handler; usable as a decorator."""
+    if handler not in _subscribers:
+        _subscribers.append(handler)
+    return handler
+
+
+def unsubscribe(handler: ContentChangedHandler) -> None:
+    """Remove a previously registered handler."""
+    if handler in _subscribers:
+        _subscribers.remove(handler)
+
+
+def publish(change: ContentChanged) -> None:
+    """Deliver an event to every subscriber; a failing subscriber does not stop the rest."""
+    for handler in list(_subscribers):
+        try:
+            handler(change)
+        except Exception:
+            logger.exception("Content change subscriber %r failed", handler)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session: Session, flush_context: UOWTransaction) -> None:
+    tables: set[str] = session.info.setdefault("changed_tables", set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table:
+            tables.add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session: Session) -> None:
+    tables = session.info.pop("changed_tables", None)
+    if tables is not None:
+        publish(ContentChanged(source="session", tables=frozenset(tables)))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop("changed_tables", None)
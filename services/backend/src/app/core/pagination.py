@@ -0,0 +1,74 @@
+"""Keyset (cursor) pagination over a fixed sort key."""
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+_VALUES: TypeAdapter[list[Any]] = TypeAdapter(list[Any])
+
+
+class InvalidCursorError(ValueError):
+    """Cursor that was not produced for this sort key."""
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """
+    Sort key of a paginated list: every column sorts in the same direction and the
+    last one is unique. A cursor is the opaque encoding of the last row's sort values.
+    """
+
+    columns: tuple[InstrumentedAttribute[Any], ...]
+    descending: bool = False
+
+    def order_by(self) -> list[ColumnElement[Any]]:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def paginate(
+        self, statement: Select[Any], cursor: str | None, limit: int | None
+    ) -> Select[Any]:
+        """Order the statement and restrict it to one page (plus a row to detect the next)."""
+        statement = statement.order_by(*self.order_by())
+        if cursor is not None:
+            key = tuple_(*self.columns)
+            bound = tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(self.columns, self.decode(cursor), strict=True)
+                )
+            )
+            statement = statement.where(key < bound if self.descending else key > bound)
+        if limit is not None:
+            statement = statement.limit(limit + 1)
+        return statement
+
+    def page(self, rows: Sequence[Any], limit: int | None) -> tuple[Sequence[Any], str | None]:
+        """Split the rows of `paginate` into the page and the cursor of the next one."""
+        if limit is None or len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, self.encode(rows[-1])
+
+    def encode(self, row: Any) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        return base64.urlsafe_b64encode(_VALUES.dump_json(values)).rstrip(b"=").decode()
+
+    def decode(self, cursor: str) -> tuple[Any, ...]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values: tuple[Any, ...] = self._cursor_adapter.validate_json(raw)
+        except (binascii.Error, ValueError, ValidationError) as exc:
+            raise InvalidCursorError("Invalid cursor") from exc
+        return values
+
+    @cached_property
+    def _cursor_adapter(self) -> TypeAdapter[Any]:
+        types = tuple(column.type.python_type for column in self.columns)
+        return TypeAdapter(tuple[types])  # type: ignore[valid-type]
@@ -0,0 +1,155 @@
+"""Connection pool instrumentation and liveness checks.
+
+`MeteredPool` records how long checkouts take, how long they wait for a free
+connection, how far into overflow the pool goes and how often connections are
+re-established (recycled after `pool_recycle`, or replaced after an
+invalidation). The metrics survive `engine.dispose()`.
+
+`check_liveness` is the cheap alternative to `pool_pre_ping`: one ping per
+interval instead of one per checkout. A ping that hits a dropped connection
+invalidates the pool, so connections older than the failure are replaced on
+their next checkout.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """Counters and timings of one pool, cumulative since startup."""
+
+    checkouts: int = 0
+    connects: int = 0
+    recycles: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    peak_overflow: int = 0
+    checkout_seconds: float = 0.0
+    checkout_max_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    wait_max_seconds: float = 0.0
+    # Outcome of the last liveness ping; stays True when liveness checks are off
+    alive: bool = True
+
+    def on_connect(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        self.connects += 1
+        # record_info outlives the DBAPI connection, unlike info
+        record_info = record.record_info
+        if record_info is None:
+            return
+        if record_info.get("connected"):
+            self.recycles += 1
+        record_info["connected"] = True
+
+    def on_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, exception: BaseException | None
+    ) -> None:
+        self.invalidations += 1
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """
+    `AsyncAdaptedQueuePool` that keeps `PoolMetrics`.
+    Pool events cover connects and invalidations but not the wait for a free
+    connection, so this relies on SQLAlchemy 2.0 pool internals: wait time is
+    measured by overriding `_do_get`, and `recreate()` is detected by the
+    `_dispatch` keyword it passes. SQLAlchemy is pinned to 2.0.x for this, and
+    tests/core/test_pool.py checks both internals are still there.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        recreated = "_dispatch" in kw
+        super().__init__(*args, **kw)
+        if not recreated:
+            # A recreated pool copies these listeners along with the dispatch
+            self.metrics = PoolMetrics()
+            event.listen(self, "connect", self.metrics.on_connect)
+            event.listen(self, "invalidate", self.metrics.on_invalidate)
+
+    def recreate(self) -> "MeteredPool":
+        pool = super().recreate()
+        assert isinstance(pool, MeteredPool)
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - started
+        metrics = self.metrics
+        metrics.checkouts += 1
+        metrics.checkout_seconds += elapsed
+        metrics.checkout_max_seconds = max(metrics.checkout_max_seconds, elapsed)
+        metrics.peak_overflow = max(metrics.peak_overflow, self.overflow())
+        return connection
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Time spent waiting for a free (or new) connection, before any pre-ping
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.wait_seconds += elapsed
+            self.metrics.wait_max_seconds = max(self.metrics.wait_max_seconds, elapsed)
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    """Current occupancy and cumulative metrics of an engine's pool."""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, MeteredPool):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **asdict(pool.metrics),
+    }
+
+
+async def open_connections(engine: AsyncEngine, count: int) -> None:
+    """Check `count` connections out at once and return them, leaving them idle in the pool."""
+    if not isinstance(engine.sync_engine.pool, MeteredPool):
+        return
+    # The task group exits first: if a connect fails, the other attempts are cancelled
+    # and awaited before the stack closes every connection that did open
+    async with AsyncExitStack() as stack, asyncio.TaskGroup() as group:
+        for _ in range(count):
+            group.create_task(stack.enter_async_context(engine.connect()))
+
+
+async def check_liveness(engine: AsyncEngine, interval: float) -> None:
+    """Ping the database every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        alive = True
+        try:
+            async with engine.connect() as connection:
+                await connection.exec_driver_sql("SELECT 1")
+        except Exception as exc:
+            # Pool timeouts and driver errors alike; the loop must outlive any of them
+            alive = False
+            logger.warning("Liveness check failed for %s: %s", engine.url.render_as_string(), exc)
+        # The pool is replaced by dispose(), so look it up on every round
+        pool = engine.sync_engine.pool
+        if isinstance(pool, MeteredPool):
+            pool.metrics.alive = alive
@@ -0,0 +1,58 @@
+"""Sparse fieldsets (`fields=a,b`) for list endpoints."""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute, load_only, noload
+from sqlalchemy.orm.interfaces import ORMOption
+
+
+class UnknownFieldError(ValueError):
+    """A requested field is not part of the response schema."""
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> frozenset[str] | None:
+    """Validate a comma-separated field list against a schema; None selects every field."""
+    if fields is None:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if not requested:
+        raise UnknownFieldError("No fields requested")
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise UnknownFieldError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+
+@lru_cache(maxsize=64)
+def partial_schema(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Schema with only `fields`, in the order the full schema declares them."""
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+def projection_options(
+    model: type[Any], fields: frozenset[str], required: Iterable[InstrumentedAttribute[Any]] = ()
+) -> list[ORMOption]:
+    """
+    Load only the requested columns (plus `required` ones, e.g. sort keys) and
+    skip the eager loads of relationships that were not requested.
+    """
+    mapper = inspect(model)
+    columns = [getattr(model, name) for name in fields if name in mapper.column_attrs]
+    options: list[ORMOption] = [load_only(*columns, *required)]
+    options.extend(
+        noload(getattr(model, name)) for name in mapper.relationships.keys() if name not in fields
+    )
+    return options
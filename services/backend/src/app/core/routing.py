@@ -0,0 +1,124 @@
+"""Read routing across replicas.
+
+Read-only sessions are bound round-robin to the healthy replicas, with the
+primary as the fallback when none is configured or all are down. Sessions stay
+lazy: a replica is only contacted when the session first needs a connection,
+so requests answered from a cache never touch a pool. A replica that fails to
+hand out a connection is taken out of rotation for a cooldown period and the
+session moves on to the next candidate; one whose connection drops mid-request
+is taken out as well.
+
+Right after content changed, reads are pinned to the primary for a short
+window, so snapshots rebuilt after the invalidation do not come from a replica
+that has not replayed the write yet. Writes never go through here.
+"""
+
+import itertools
+import time
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+
+class ReplicaRouter:
+    """Picks the engine for the next read-only session."""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        cooldown: float = 30.0,
+        primary_window: float = 0.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.cooldown = cooldown
+        self.primary_window = primary_window
+        self._turn = itertools.count()
+        self._down_until = [0.0] * len(self.replicas)
+        self._primary_until = 0.0
+        for index, replica in enumerate(self.replicas):
+            event.listen(replica.sync_engine, "handle_error", partial(self._on_error, index))
+
+    def candidates(self) -> list[AsyncEngine]:
+        """Healthy replicas, starting with the one whose turn it is, then the primary."""
+        now = time.monotonic()
+        if now < self._primary_until:
+            return [self.primary]
+        healthy = [
+            replica
+            for replica, down_until in zip(self.replicas, self._down_until, strict=True)
+            if down_until <= now
+        ]
+        if healthy:
+            start = next(self._turn) % len(healthy)
+            healthy = healthy[start:] + healthy[:start]
+        return [*healthy, self.primary]
+
+    def choose(self) -> AsyncEngine:
+        return self.candidates()[0]
+
+    def mark_down(self, engine: AsyncEngine | Engine) -> None:
+        """Skip a replica until the cooldown has passed; the primary is never skipped."""
+        for index, replica in enumerate(self.replicas):
+            if engine is replica or engine is replica.sync_engine:
+                self._down_until[index] = time.monotonic() + self.cooldown
+
+    def pin_to_primary(self) -> None:
+        """Send reads to the primary for `primary_window` seconds, e.g. after a write."""
+        self._primary_until = time.monotonic() + self.primary_window
+
+    def failover(self, failed: Engine) -> AsyncEngine | None:
+        """Take a replica that could not connect out of rotation; returns the next candidate."""
+        if failed is self.primary.sync_engine:
+            return None
+        self.mark_down(failed)
+        return self.choose()
+
+    def _on_error(self, index: int, context: ExceptionContext) -> None:
+        if context.is_disconnect:
+            self._down_until[index] = time.monotonic() + self.cooldown
+
+
+class RoutingSession(Session):
+    """Sync session behind a read-only `AsyncSession`; fails over when connecting fails."""
+
+    def __init__(self, *args: Any, router: ReplicaRouter, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.router = router
+
+    def _connection_for_bind(
+        self,
+        engine: Engine | Connection,
+        execution_options: Any = None,
+        **kw: Any,
+    ) -> Connection:
+        while True:
+            try:
+                return super()._connection_for_bind(engine, execution_options, **kw)
+            except (DBAPIError, OSError):
+                # The transaction holds no connection yet, so it can start over elsewhere
+                if not isinstance(engine, Engine):
+                    raise
+                fallback = self.router.failover(engine)
+                if fallback is None:
+                    raise
+                engine = self.bind = fallback.sync_engine
+
+
+class RoutingSessionMaker(async_sessionmaker[AsyncSession]):
+    """Session factory that binds every new session to the router's next engine."""
+
+    def __init__(self, router: ReplicaRouter, **kw: Any) -> None:
+        super().__init__(sync_session_class=RoutingSession, router=router, **kw)
+        self.router = router
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        local_kw.setdefault("bind", self.router.choose())
+        return super().__call__(**local_kw)
@@ -0,0 +1,35 @@
+"""Admin authorization for API endpoints outside the SQLAdmin panel."""
+
+import secrets
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+
+from app.config import settings
+
+_basic = HTTPBasic(auto_error=False)
+
+
+def require_admin(
+    request: Request, credentials: HTTPBasicCredentials | None = Depends(_basic)
+) -> None:
+    """
+    Allow a signed-in admin panel session or HTTP Basic admin credentials
+    (for scripts such as backups).
+    """
+    if request.session.get("authenticated"):
+        return
+    if credentials is not None:
+        username_ok = secrets.compare_digest(
+            credentials.username.encode(), settings.ADMIN_USERNAME.encode()
+        )
+        password_ok = secrets.compare_digest(
+            credentials.password.encode(), settings.ADMIN_PASSWORD.encode()
+        )
+        if username_ok and password_ok:
+            return
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Admin credentials required",
+        headers={"WWW-Authenticate": "Basic"},
+    )
@@ -1,26 +1,49 @@
 """Database configuration with SQLAlchemy async engine."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
+from app.core.events import ContentChanged, subscribe
+from app.core.pool import MeteredPool, check_liveness, open_connections
+from app.core.routing import ReplicaRouter, RoutingSessionMaker
+
 
-# Create async engine
-engine_args: dict[str, Any] = {
-    "echo": False,
-    "pool_pre_ping": True,
-}
+def _engine_args(url: str) -> dict[str, Any]:
+    engine_args: dict[str, Any] = {
+        "echo": False,
+        # Periodic liveness checks replace the ping on every checkout when enabled
+        "pool_pre_ping": settings.DATABASE_LIVENESS_INTERVAL <= 0,
+        # Compiled SQL per distinct statement shape, shared by all connections
+        "query_cache_size": settings.DATABASE_QUERY_CACHE_SIZE,
+    }
+    if "+asyncpg" in url:
+        # Server-side prepared statements, per connection
+        engine_args["connect_args"] = {
+            "prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE
+        }
+    if "sqlite" not in url:
+        engine_args["poolclass"] = MeteredPool
+        engine_args["pool_size"] = settings.DATABASE_POOL_SIZE
+        engine_args["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
+        engine_args["pool_timeout"] = settings.DATABASE_POOL_TIMEOUT
+        engine_args["pool_recycle"] = settings.DATABASE_POOL_RECYCLE
+    return engine_args
 
-if "sqlite" not in str(settings.DATABASE_URL):
-    engine_args["pool_size"] = 10
-    engine_args["max_overflow"] = 20
 
+# Create async engine (the primary: every write, SQLAdmin included, goes here)
 engine = create_async_engine(
     str(settings.DATABASE_URL),
-    **engine_args,
+    **_engine_args(str(settings.DATABASE_URL)),
 )
 
 # Create async session factory
@@ -32,6 +55,41 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+replica_engines = [
+    create_async_engine(url, **_engine_args(url)) for url in settings.DATABASE_REPLICA_URLS
+]
+
+
+def _read_only(read_engine: AsyncEngine) -> AsyncEngine:
+    if read_engine.dialect.name == "postgresql":
+        # Transactions open with BEGIN READ ONLY: same effect as SET TRANSACTION READ ONLY
+        # without the extra statement
+        return read_engine.execution_options(postgresql_readonly=True)
+    return read_engine
+
+
+replica_router = ReplicaRouter(
+    _read_only(engine),
+    [_read_only(replica) for replica in replica_engines],
+    cooldown=settings.DATABASE_REPLICA_COOLDOWN,
+    primary_window=settings.DATABASE_REPLICA_PRIMARY_WINDOW,
+)
+
+
+@subscribe
+def _read_from_primary_after_writes(change: ContentChanged) -> None:
+    # Caches were just invalidated; rebuild them from data that has the write
+    replica_router.pin_to_primary()
+
+
+# Read-only sessions, round-robin over the healthy replicas (or the primary)
+ReadSessionLocal = RoutingSessionMaker(
+    replica_router,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
@@ -48,3 +106,53 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for requests that only read. Nothing is committed: the read-only
+    transaction ends when the connection goes back to the pool.
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for reads that need several independent sessions per request."""
+    return ReadSessionLocal
+
+
+def monitored_engines() -> dict[str, AsyncEngine]:
+    """Every engine with its own pool, by display name."""
+    engines = {"primary": engine}
+    engines.update(
+        (f"replica-{number}", replica) for number, replica in enumerate(replica_engines, start=1)
+    )
+    return engines
+
+
+def start_liveness_checks() -> list[asyncio.Task[None]]:
+    """Background pings for every pool when `DATABASE_LIVENESS_INTERVAL` is set."""
+    if settings.DATABASE_LIVENESS_INTERVAL <= 0:
+        return []
+    return [
+        asyncio.create_task(check_liveness(pool_engine, settings.DATABASE_LIVENESS_INTERVAL))
+        for pool_engine in monitored_engines().values()
+    ]
+
+
+async def open_pool_connections() -> None:
+    """Establish `DATABASE_POOL_SIZE` connections in every pool ahead of traffic."""
+    await asyncio.gather(
+        *(
+            open_connections(pool_engine, settings.DATABASE_POOL_SIZE)
+            for pool_engine in monitored_engines().values()
+        )
+    )
+
+
+async def dispose_engines() -> None:
+    """Close the pools of the primary and every replica."""
+    await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -8,19 +9,26 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.admin import setup_admin
-from app.api.v1 import health, profile
+from app.api.v1 import health, profile, search
 from app.config import settings
-from app.database import engine
+from app.database import dispose_engines, engine, start_liveness_checks
+from app.services.warmup import warm_up
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager."""
     # Startup
-    # Connection pool is created automatically on first use
+    # Requests are not served until startup completes, so traffic meets warm caches
+    if settings.PROFILE_WARM_UP:
+        await warm_up(app)
+    liveness_checks = start_liveness_checks()
     yield
     # Shutdown
-    await engine.dispose()
+    for task in liveness_checks:
+        task.cancel()
+    await asyncio.gather(*liveness_checks, return_exceptions=True)
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -40,12 +48,14 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 # Setup admin panel
 setup_admin(app, engine)
 
 app.include_router(profile.router, prefix=settings.API_V1_STR)
+app.include_router(search.router, prefix=settings.API_V1_STR)
 
 # API routes
 app.include_router(health.router, prefix="/api", tags=["health"])
@@ -1,7 +1,8 @@
 from app.models.contact import Contact, ContactTranslation
 from app.models.project import Project, ProjectTranslation, project_stacks
 from app.models.resume import Resume
-from app.models.stack import Stack
+from app.models.stack import Stack, StackUsage
+from app.models.stack_usage import refresh_stack_usage
 from app.models.testimonial import Testimonial, TestimonialTranslation
 from app.models.work_experience import (
     WorkExperience,
@@ -17,6 +18,8 @@ __all__ = [
     "project_stacks",
     "Resume",
     "Stack",
+    "StackUsage",
+    "refresh_stack_usage",
     "Testimonial",
     "TestimonialTranslation",
     "WorkExperience",
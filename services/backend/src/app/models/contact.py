@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint, Uuid
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -27,6 +27,9 @@ class Contact(Base, TimestampMixin):
         back_populates="contact", cascade="all, delete-orphan", lazy="selectin"
     )
 
+    # Index for the visible contacts in display order
+    __table_args__ = (Index("ix_contacts_is_visible_sort_order", "is_visible", "sort_order"),)
+
     def __repr__(self) -> str:
         return f"<Contact {self.type}: {self.value}>"
 
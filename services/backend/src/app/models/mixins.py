@@ -1,7 +1,10 @@
+from collections import defaultdict
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, event, inspect, update
+from sqlalchemy.orm import Mapped, Mapper, Session, UOWTransaction, mapped_column
+from sqlalchemy.orm.interfaces import MANYTOONE
 from sqlalchemy.sql import func
 
 
@@ -17,3 +20,48 @@ class TimestampMixin:
         onupdate=func.now(),
         nullable=False,
     )
+
+
+def _touched_parents(session: Session) -> dict[Mapper[Any], set[Any]]:
+    """
+    Timestamped rows whose translations or stacks changed in the flush that just ran.
+    Such changes write only the child and association tables, so `onupdate` never fires.
+    """
+    touched: dict[Mapper[Any], set[Any]] = defaultdict(set)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        state = inspect(instance)
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+        for relationship in state.mapper.relationships:
+            if relationship.viewonly:
+                continue
+            parent = relationship.mapper
+            if relationship.direction is MANYTOONE and issubclass(parent.class_, TimestampMixin):
+                # A translation row: its foreign key names the parent
+                for local, _ in relationship.local_remote_pairs:
+                    key = state.mapper.get_property_by_column(local).key
+                    if state.dict.get(key) is not None:
+                        touched[parent].add(state.dict[key])
+            elif (
+                relationship.uselist
+                and instance in session.dirty
+                and isinstance(instance, TimestampMixin)
+                and state.attrs[relationship.key].history.has_changes()
+            ):
+                # Linked or unlinked stacks, translations removed as orphans
+                (identity,) = state.identity or (None,)
+                touched[state.mapper].add(identity)
+    return touched
+
+
+@event.listens_for(Session, "after_flush")
+def _touch_parents_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    # Keeps Last-Modified of parents moving when only their children changed
+    connection = session.connection()
+    for mapper, ids in _touched_parents(session).items():
+        ids.discard(None)
+        if ids:
+            (key,) = mapper.primary_key
+            connection.execute(
+                update(mapper.class_).where(key.in_(ids)).values(updated_at=func.now())
+            )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Column,
     Date,
     ForeignKey,
+    Index,
     String,
     Table,
     Text,
@@ -24,6 +25,8 @@ project_stacks = Table(
     Base.metadata,
     Column("project_id", Uuid(as_uuid=True), ForeignKey("projects.id"), primary_key=True),
     Column("stack_id", Uuid(as_uuid=True), ForeignKey("stacks.id"), primary_key=True),
+    # Reverse lookup: projects built with a stack (the primary key leads with project_id)
+    Index("ix_project_stacks_stack_id", "stack_id"),
 )
 
 
@@ -47,7 +50,14 @@ class Project(Base, TimestampMixin):
     translations: Mapped[list["ProjectTranslation"]] = relationship(
         back_populates="project", cascade="all, delete-orphan", lazy="selectin"
     )
-    stacks: Mapped[list[Stack]] = relationship(secondary=project_stacks, lazy="selectin")
+    stacks: Mapped[list[Stack]] = relationship(
+        secondary=project_stacks, lazy="selectin", order_by=Stack.name
+    )
+
+    # Index for the keyset order of /profile/projects
+    __table_args__ = (
+        Index("ix_projects_is_featured_start_date_id", "is_featured", "start_date", "id"),
+    )
 
     def __repr__(self) -> str:
         return f"<Project {self.slug}>"
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Uuid
+from sqlalchemy import Boolean, DateTime, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -21,5 +21,8 @@ class Resume(Base):
     generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Index for the active resumes by language
+    __table_args__ = (Index("ix_resumes_is_active_language_code", "is_active", "language_code"),)
+
     def __repr__(self) -> str:
         return f"<Resume {self.language_code} - {self.file_path}>"
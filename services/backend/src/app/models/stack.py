@@ -1,6 +1,7 @@
 import uuid
+from datetime import date
 
-from sqlalchemy import Integer, String, Uuid
+from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -23,3 +24,24 @@ class Stack(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Stack {self.name}>"
+
+
+class StackUsage(Base):
+    """
+    Precomputed usage of a stack across projects and work experience.
+    Maintained on flush by app.models.stack_usage; never edited directly.
+    """
+
+    __tablename__ = "stack_usage"
+
+    stack_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("stacks.id", ondelete="CASCADE"), primary_key=True
+    )
+    project_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    experience_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_used: Mapped[date | None] = mapped_column(Date, nullable=True)
+    last_used: Mapped[date | None] = mapped_column(Date, nullable=True)
+    in_use: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    def __repr__(self) -> str:
+        return f"<StackUsage {self.stack_id}>"
@@ -0,0 +1,128 @@
+"""Incremental maintenance of the precomputed `stack_usage` rows.
+
+After every flush the stacks it touched are collected: stacks created or deleted,
+and stacks linked to (or unlinked from) projects and work experience whose stacks
+or dates changed. Only their rows are recomputed, in the same transaction, so the
+usage is never visible out of sync with the association tables.
+"""
+
+import uuid
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Subquery,
+    case,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.models.project import Project, project_stacks
+from app.models.stack import Stack, StackUsage
+from app.models.work_experience import WorkExperience, work_experience_stacks
+
+# Attributes whose change can alter the usage of the linked stacks
+_USAGE_ATTRIBUTES: dict[type[Any], tuple[str, ...]] = {
+    Project: ("stacks", "start_date", "end_date"),
+    WorkExperience: ("stacks", "start_date", "end_date", "is_current"),
+}
+
+
+def refresh_stack_usage(connection: Connection, stack_ids: Collection[uuid.UUID]) -> None:
+    """Recompute the usage rows of the given stacks from the association tables."""
+    if not stack_ids:
+        return
+    ids = list(stack_ids)
+    entries = _linked_entries(ids)
+    usage = (
+        select(
+            Stack.id,
+            func.count(case((entries.c.kind == "project", 1))),
+            func.count(case((entries.c.kind == "experience", 1))),
+            func.min(entries.c.start_date),
+            func.max(entries.c.end_date),
+            func.coalesce(func.max(entries.c.ongoing), 0) == 1,
+        )
+        .outerjoin(entries, entries.c.stack_id == Stack.id)
+        .where(Stack.id.in_(ids))
+        .group_by(Stack.id)
+    )
+    connection.execute(delete(StackUsage).where(StackUsage.stack_id.in_(ids)))
+    connection.execute(
+        insert(StackUsage).from_select(
+            [
+                "stack_id",
+                "project_count",
+                "experience_count",
+                "first_used",
+                "last_used",
+                "in_use",
+            ],
+            usage,
+        )
+    )
+
+
+def _linked_entries(stack_ids: list[uuid.UUID]) -> Subquery:
+    """One row per (stack, linked entry) with the entry's date span."""
+    projects = (
+        select(
+            project_stacks.c.stack_id.label("stack_id"),
+            literal("project").label("kind"),
+            Project.start_date.label("start_date"),
+            func.coalesce(Project.end_date, Project.start_date).label("end_date"),
+            case((Project.end_date.is_(None), 1), else_=0).label("ongoing"),
+        )
+        .join(Project, Project.id == project_stacks.c.project_id)
+        .where(project_stacks.c.stack_id.in_(stack_ids))
+    )
+    experience = (
+        select(
+            work_experience_stacks.c.stack_id,
+            literal("experience"),
+            WorkExperience.start_date,
+            func.coalesce(WorkExperience.end_date, WorkExperience.start_date),
+            case((WorkExperience.is_current, 1), else_=0),
+        )
+        .join(WorkExperience, WorkExperience.id == work_experience_stacks.c.work_experience_id)
+        .where(work_experience_stacks.c.stack_id.in_(stack_ids))
+    )
+    return union_all(projects, experience).subquery()
+
+
+def _affected_stack_ids(session: Session) -> set[uuid.UUID]:
+    """Stacks whose usage may have changed in the flush that just ran."""
+    stack_ids: set[uuid.UUID] = set()
+    for instance in (*session.new, *session.deleted):
+        if isinstance(instance, Stack):
+            stack_ids.add(instance.id)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        attributes = _USAGE_ATTRIBUTES.get(type(instance))
+        if attributes is None:
+            continue
+        state = inspect(instance)
+        if instance in session.dirty and not any(
+            state.attrs[name].history.has_changes() for name in attributes
+        ):
+            continue
+        history = state.attrs.stacks.history
+        stack_ids.update(
+            stack.id for stack in (*history.added, *history.unchanged, *history.deleted)
+        )
+    return stack_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    # new/dirty/deleted and attribute history still describe the flush here
+    stack_ids = _affected_stack_ids(session)
+    if stack_ids:
+        refresh_stack_usage(session.connection(), stack_ids)
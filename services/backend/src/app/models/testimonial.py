@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import Date, ForeignKey, String, Text, UniqueConstraint, Uuid
+from sqlalchemy import Date, ForeignKey, Index, String, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -28,6 +28,9 @@ class Testimonial(Base, TimestampMixin):
         back_populates="testimonial", cascade="all, delete-orphan", lazy="selectin"
     )
 
+    # Index for the keyset order of /profile/testimonials
+    __table_args__ = (Index("ix_testimonials_date_id", "date", "id"),)
+
     def __repr__(self) -> str:
         return f"<Testimonial from {self.author_name}>"
 
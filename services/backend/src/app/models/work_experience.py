@@ -6,6 +6,7 @@ from sqlalchemy import (
     Column,
     Date,
     ForeignKey,
+    Index,
     String,
     Table,
     Text,
@@ -29,6 +30,8 @@ work_experience_stacks = Table(
         primary_key=True,
     ),
     Column("stack_id", Uuid(as_uuid=True), ForeignKey("stacks.id"), primary_key=True),
+    # Reverse lookup: experience using a stack (the primary key leads with work_experience_id)
+    Index("ix_work_experience_stacks_stack_id", "stack_id"),
 )
 
 
@@ -51,7 +54,12 @@ class WorkExperience(Base, TimestampMixin):
     translations: Mapped[list["WorkExperienceTranslation"]] = relationship(
         back_populates="work_experience", cascade="all, delete-orphan", lazy="selectin"
     )
-    stacks: Mapped[list[Stack]] = relationship(secondary=work_experience_stacks, lazy="selectin")
+    stacks: Mapped[list[Stack]] = relationship(
+        secondary=work_experience_stacks, lazy="selectin", order_by=Stack.name
+    )
+
+    # Index for the keyset order of /profile/experience
+    __table_args__ = (Index("ix_work_experiences_start_date_id", "start_date", "id"),)
 
     def __repr__(self) -> str:
         return f"<WorkExperience {self.company_name}>"
@@ -28,3 +28,9 @@ from .profile import (
 from .profile import (
     WorkExperienceTranslationRead as WorkExperienceTranslationRead,
 )
+from .search import (
+    SearchHit as SearchHit,
+)
+from .search import (
+    SearchResults as SearchResults,
+)
@@ -0,0 +1,127 @@
+"""NDJSON exchange records: one self-contained entity per line, tagged by `entity`."""
+
+import uuid
+from datetime import date, datetime
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class ExchangeModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
+
+
+def _stack_names(value: Any) -> Any:
+    """Association rows are exchanged as stack names, the stacks' natural key."""
+    if isinstance(value, list):
+        return [getattr(item, "name", item) for item in value]
+    return value
+
+
+class StackRecord(ExchangeModel):
+    entity: Literal["stack"] = "stack"
+    name: str
+    icon_url: str | None = None
+    category: str | None = None
+    proficiency: int | None = None
+
+
+class WorkExperienceTranslationRecord(ExchangeModel):
+    language_code: str
+    position: str
+    description: str
+    location: str | None = None
+
+
+class WorkExperienceRecord(ExchangeModel):
+    entity: Literal["work_experience"] = "work_experience"
+    id: uuid.UUID
+    company_name: str
+    company_url: str | None = None
+    start_date: date
+    end_date: date | None = None
+    is_current: bool = False
+    translations: list[WorkExperienceTranslationRecord] = []
+    stacks: list[str] = []
+
+    stack_names = field_validator("stacks", mode="before")(_stack_names)
+
+
+class ProjectTranslationRecord(ExchangeModel):
+    language_code: str
+    title: str
+    description: str
+    role: str | None = None
+
+
+class ProjectRecord(ExchangeModel):
+    entity: Literal["project"] = "project"
+    slug: str
+    link: str | None = None
+    repo_link: str | None = None
+    start_date: date
+    end_date: date | None = None
+    is_featured: bool = False
+    translations: list[ProjectTranslationRecord] = []
+    stacks: list[str] = []
+
+    stack_names = field_validator("stacks", mode="before")(_stack_names)
+
+
+class TestimonialTranslationRecord(ExchangeModel):
+    language_code: str
+    author_position: str | None = None
+    content: str
+
+
+class TestimonialRecord(ExchangeModel):
+    entity: Literal["testimonial"] = "testimonial"
+    id: uuid.UUID
+    author_name: str
+    author_url: str | None = None
+    author_avatar_url: str | None = None
+    kind: str | None = None
+    date: date
+    translations: list[TestimonialTranslationRecord] = []
+
+
+class ContactTranslationRecord(ExchangeModel):
+    language_code: str
+    label: str | None = None
+
+
+class ContactRecord(ExchangeModel):
+    entity: Literal["contact"] = "contact"
+    id: uuid.UUID
+    type: str
+    value: str
+    icon: str | None = None
+    is_visible: bool = True
+    sort_order: int = 0
+    translations: list[ContactTranslationRecord] = []
+
+
+class ResumeRecord(ExchangeModel):
+    entity: Literal["resume"] = "resume"
+    id: uuid.UUID
+    language_code: str
+    file_path: str
+    generated_at: datetime
+    is_active: bool = True
+
+
+ExchangeRecord = Annotated[
+    StackRecord
+    | WorkExperienceRecord
+    | ProjectRecord
+    | TestimonialRecord
+    | ContactRecord
+    | ResumeRecord,
+    Field(discriminator="entity"),
+]
+
+
+class ImportSummary(BaseModel):
+    """Rows upserted per entity by an import."""
+
+    imported: dict[str, int]
@@ -177,3 +177,20 @@ class ProfileFullRead(BaseModel):
     testimonials: list[LocalizedTestimonialRead]
     contacts: list[LocalizedContactRead]
     resumes: list[ResumeRead]
+
+
+class StackUsageRead(BaseModel):
+    project_count: int = 0
+    experience_count: int = 0
+    first_used: date | None = None
+    last_used: date | None = None
+    in_use: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StackEntriesRead(BaseModel):
+    stack: StackRead
+    usage: StackUsageRead
+    experience: list[LocalizedWorkExperienceRead]
+    projects: list[LocalizedProjectRead]
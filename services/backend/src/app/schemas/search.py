@@ -0,0 +1,21 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel
+
+SearchKind = Literal["project", "experience", "testimonial"]
+
+
+class SearchHit(BaseModel):
+    kind: SearchKind
+    id: uuid.UUID
+    slug: str | None
+    title: str
+    snippet: str
+    rank: float
+
+
+class SearchResults(BaseModel):
+    query: str
+    lang: str
+    hits: list[SearchHit]
@@ -0,0 +1,284 @@
+"""NDJSON export and import of all profile content.
+
+Export: rows are streamed through a server-side cursor in fixed-size partitions;
+each partition is serialized and then expunged from the session, so memory use is
+bounded by the partition size (plus the shared stacks) rather than the dataset.
+
+Import: lines are validated as they stream in and upserted in batches with
+INSERT ... ON CONFLICT, keyed on `slug` (projects), `name` (stacks), `id` (other
+entities) and `(entity_id, language_code)` (translations). A record is
+authoritative for its translations and stacks. Everything runs in one
+transaction that is rolled back on the first invalid line.
+"""
+
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Table, delete, func, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.events import ContentChanged, publish
+from app.models.contact import Contact, ContactTranslation
+from app.models.mixins import TimestampMixin
+from app.models.project import Project, ProjectTranslation, project_stacks
+from app.models.resume import Resume
+from app.models.stack import Stack
+from app.models.stack_usage import refresh_stack_usage
+from app.models.testimonial import Testimonial, TestimonialTranslation
+from app.models.work_experience import (
+    WorkExperience,
+    WorkExperienceTranslation,
+    work_experience_stacks,
+)
+from app.schemas.exchange import (
+    ContactRecord,
+    ExchangeModel,
+    ExchangeRecord,
+    ProjectRecord,
+    ResumeRecord,
+    StackRecord,
+    TestimonialRecord,
+    WorkExperienceRecord,
+)
+
+EXPORT_BATCH_SIZE = 500
+
+# Export order: stacks first, so an import can resolve stack names as it streams
+EXPORTED_ENTITIES: tuple[tuple[type[Any], Any, type[ExchangeModel]], ...] = (
+    (Stack, Stack.name, StackRecord),
+    (WorkExperience, WorkExperience.start_date, WorkExperienceRecord),
+    (Project, Project.slug, ProjectRecord),
+    (Testimonial, Testimonial.date, TestimonialRecord),
+    (Contact, Contact.sort_order, ContactRecord),
+    (Resume, Resume.language_code, ResumeRecord),
+)
+
+
+async def export_ndjson(
+    session_factory: async_sessionmaker[AsyncSession], batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield every entity, with its translations and stack names, as NDJSON chunks."""
+    async with session_factory() as session:
+        for model, order, record in EXPORTED_ENTITIES:
+            statement = (
+                select(model).order_by(order, model.id).execution_options(yield_per=batch_size)
+            )
+            result = await session.stream_scalars(statement)
+            async for partition in result.partitions():
+                yield b"".join(
+                    record.model_validate(row).model_dump_json().encode() + b"\n"
+                    for row in partition
+                )
+                # expunge_all() would invalidate the identity map the cursor is loading into;
+                # expunging rows also drops their translations (cascade="all")
+                for row in partition:
+                    session.expunge(row)
+
+
+IMPORT_BATCH_SIZE = 500
+
+_RECORD: TypeAdapter[ExchangeRecord] = TypeAdapter(ExchangeRecord)
+
+
+class ImportValidationError(ValueError):
+    """Import input that cannot be applied; nothing was written."""
+
+
+@dataclass(frozen=True)
+class _ImportSpec:
+    model: type[Any]
+    key: tuple[str, ...]
+    translation: type[Any] | None = None
+    parent_fk: str = ""
+    association: Table | None = None
+
+
+_IMPORT_SPECS: dict[str, _ImportSpec] = {
+    "stack": _ImportSpec(Stack, ("name",)),
+    "work_experience": _ImportSpec(
+        WorkExperience,
+        ("id",),
+        WorkExperienceTranslation,
+        "work_experience_id",
+        work_experience_stacks,
+    ),
+    "project": _ImportSpec(Project, ("slug",), ProjectTranslation, "project_id", project_stacks),
+    "testimonial": _ImportSpec(Testimonial, ("id",), TestimonialTranslation, "testimonial_id"),
+    "contact": _ImportSpec(Contact, ("id",), ContactTranslation, "contact_id"),
+    "resume": _ImportSpec(Resume, ("id",)),
+}
+
+
+async def import_ndjson(
+    session: AsyncSession, chunks: AsyncIterable[bytes], batch_size: int = IMPORT_BATCH_SIZE
+) -> dict[str, int]:
+    """Validate and upsert an NDJSON stream in one transaction; returns rows per entity."""
+    importer = _Importer(session, batch_size)
+    try:
+        line_number = 0
+        async for line in _lines(chunks):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = _RECORD.validate_json(line)
+            except ValidationError as exc:
+                error = exc.errors()[0]
+                message = error["msg"]
+                # Errors of the line as a whole, such as invalid JSON, have no location
+                if error["loc"]:
+                    location = ".".join(str(part) for part in error["loc"])
+                    message = f"{location}: {message}"
+                raise ImportValidationError(f"Line {line_number}: {message}") from exc
+            await importer.add(record)
+        await importer.finish()
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    # Core statements bypass the ORM flush events, so announce the change here
+    publish(ContentChanged(source="import", tables=frozenset(importer.tables)))
+    return dict(importer.counts)
+
+
+class _Importer:
+    """Collects consecutive records of one entity and upserts them in batches."""
+
+    def __init__(self, session: AsyncSession, batch_size: int) -> None:
+        self.session = session
+        self.batch_size = batch_size
+        dialect = session.get_bind().dialect.name
+        self.insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        self.pending: list[Any] = []
+        self.counts: Counter[str] = Counter()
+        self.tables: set[str] = set()
+        self.stack_ids: dict[str, uuid.UUID] = {}
+        self.touched_stacks: set[uuid.UUID] = set()
+
+    async def add(self, record: Any) -> None:
+        if self.pending and self.pending[0].entity != record.entity:
+            await self.flush()
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def finish(self) -> None:
+        await self.flush()
+        if self.touched_stacks:
+            stack_ids = self.touched_stacks
+            await self.session.run_sync(
+                lambda session: refresh_stack_usage(session.connection(), stack_ids)
+            )
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        records, self.pending = self.pending, []
+        spec = _IMPORT_SPECS[records[0].entity]
+        # The last occurrence of a key wins; one statement cannot upsert a row twice
+        by_key = {tuple(getattr(record, name) for name in spec.key): record for record in records}
+        rows = [
+            record.model_dump(exclude={"entity", "translations", "stacks"})
+            for record in by_key.values()
+        ]
+        ids = await self._upsert(spec.model, rows, spec.key)
+        self.counts[records[0].entity] += len(rows)
+        self.tables.add(spec.model.__tablename__)
+        if spec.model is Stack:
+            self.stack_ids.update({key[0]: stack_id for key, stack_id in ids.items()})
+            self.touched_stacks.update(ids.values())
+            return
+
+        parents = {ids[key]: record for key, record in by_key.items()}
+        if spec.translation is not None:
+            await self._replace_translations(spec, parents)
+        if spec.association is not None:
+            await self._replace_stacks(spec, spec.association, parents)
+
+    async def _upsert(
+        self, model: type[Any], rows: list[dict[str, Any]], key: tuple[str, ...]
+    ) -> dict[tuple[Any, ...], uuid.UUID]:
+        """Insert or update rows on `key`; returns the row id for every key."""
+        for row in rows:
+            row.setdefault("id", uuid.uuid4())
+        statement = self.insert(model).values(rows)
+        updates: dict[str, Any] = {
+            name: statement.excluded[name] for name in rows[0] if name not in (*key, "id")
+        }
+        if issubclass(model, TimestampMixin):
+            updates["updated_at"] = func.now()
+        returning = (model.id, *(getattr(model, name) for name in key))
+        result = await self.session.execute(
+            statement.on_conflict_do_update(index_elements=list(key), set_=updates).returning(
+                *returning
+            )
+        )
+        return {tuple(row[1:]): row[0] for row in result}
+
+    async def _replace_translations(self, spec: _ImportSpec, parents: dict[uuid.UUID, Any]) -> None:
+        translation = spec.translation
+        assert translation is not None
+        parent_fk = getattr(translation, spec.parent_fk)
+        rows = [
+            {spec.parent_fk: parent_id, **item.model_dump()}
+            for parent_id, record in parents.items()
+            for item in {item.language_code: item for item in record.translations}.values()
+        ]
+        if rows:
+            await self._upsert(translation, rows, (spec.parent_fk, "language_code"))
+            self.tables.add(translation.__tablename__)
+        stale = delete(translation).where(parent_fk.in_(parents))
+        if rows:
+            kept = [(row[spec.parent_fk], row["language_code"]) for row in rows]
+            stale = stale.where(tuple_(parent_fk, translation.language_code).not_in(kept))
+        await self.session.execute(stale)
+
+    async def _replace_stacks(
+        self, spec: _ImportSpec, association: Table, parents: dict[uuid.UUID, Any]
+    ) -> None:
+        names = {name for record in parents.values() for name in record.stacks}
+        await self._resolve_stacks(names)
+        parent_fk = association.c[spec.parent_fk]
+        previous = await self.session.execute(
+            select(association.c.stack_id).where(parent_fk.in_(parents))
+        )
+        self.touched_stacks.update(previous.scalars())
+        await self.session.execute(delete(association).where(parent_fk.in_(parents)))
+        rows = [
+            {spec.parent_fk: parent_id, "stack_id": self.stack_ids[name]}
+            for parent_id, record in parents.items()
+            for name in dict.fromkeys(record.stacks)
+        ]
+        if rows:
+            await self.session.execute(association.insert(), rows)
+            self.touched_stacks.update(row["stack_id"] for row in rows)
+        self.tables.add(association.name)
+
+    async def _resolve_stacks(self, names: set[str]) -> None:
+        unknown = names - self.stack_ids.keys()
+        if not unknown:
+            return
+        result = await self.session.execute(
+            select(Stack.name, Stack.id).where(Stack.name.in_(unknown))
+        )
+        self.stack_ids.update(result.tuples().all())
+        missing = unknown - self.stack_ids.keys()
+        if missing:
+            raise ImportValidationError(f"Unknown stacks: {', '.join(sorted(missing))}")
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without buffering more than one partial line."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
@@ -0,0 +1,119 @@
+"""Readiness checks.
+
+None of them queries the database per probe: pool state comes from the pool
+itself and the liveness pings, the cache state from the warm-up and the profile
+cache, and the migration check runs at most once per `HEALTH_PROBE_TTL`.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.types import ASGIApp
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from app.config import settings
+from app.core.cache import SnapshotCache
+from app.core.pool import MeteredPool
+from app.database import engine, monitored_engines
+from app.services.warmup import WarmUpState, warm_up, warm_up_state
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[3] / "alembic"
+
+
+class CheckResult(BaseModel):
+    ok: bool
+    detail: str
+
+
+# Results of the checks that are too expensive to run on every probe;
+# content writes do not affect them, so they only expire
+_probes: SnapshotCache[CheckResult] = SnapshotCache(
+    ttl=settings.HEALTH_PROBE_TTL, invalidate_on_change=False
+)
+
+# Warm-up started by a probe that found the cache cold; at most one at a time
+_rewarm_tasks: "set[asyncio.Task[WarmUpState]]" = set()
+
+# What a probe refills: the entries the readiness check looks at
+REWARM_REQUESTS: tuple[tuple[str, str], ...] = (("/full", "lang={lang}"),)
+
+
+async def check_readiness(
+    app: ASGIApp, profile_cache: SnapshotCache[Any]
+) -> dict[str, CheckResult]:
+    """Every readiness check by name; the worker is ready when all pass."""
+    return {
+        "pool": check_pools(),
+        "cache": check_cache(app, profile_cache),
+        "migrations": await _probes.get_or_build("migrations", _check_migrations),
+    }
+
+
+def check_pools() -> CheckResult:
+    """Every pool has a free connection and passed its last liveness ping."""
+    capacity = settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    problems = []
+    for name, pool_engine in monitored_engines().items():
+        pool = pool_engine.sync_engine.pool
+        if not isinstance(pool, MeteredPool):
+            continue
+        if not pool.metrics.alive:
+            problems.append(f"{name}: liveness check failed")
+        elif pool.checkedout() >= capacity:
+            problems.append(f"{name}: all {capacity} connections checked out")
+    return CheckResult(ok=not problems, detail="; ".join(problems) or "connections available")
+
+
+def check_cache(app: ASGIApp, profile_cache: SnapshotCache[Any]) -> CheckResult:
+    """
+    Passes once the startup warm-up has completed, even if entries have since expired
+    or been evicted by content changes; before that, only when the full profile of every
+    language in `PROFILE_LANGUAGES` is cached.
+    Missing entries are rewarmed in the background, never inside the probe.
+    """
+    if not settings.PROFILE_WARM_UP:
+        return CheckResult(ok=True, detail="warm-up disabled")
+    missing = [
+        lang for lang in settings.PROFILE_LANGUAGES if profile_cache.get(("full", lang)) is None
+    ]
+    if not missing:
+        return CheckResult(ok=True, detail="warm")
+    _start_rewarm(app, missing)
+    if warm_up_state.completed:
+        return CheckResult(ok=True, detail=f"warmed up, refilling: {', '.join(missing)}")
+    return CheckResult(ok=False, detail=f"not cached: {', '.join(missing)}")
+
+
+def _start_rewarm(app: ASGIApp, languages: list[str]) -> None:
+    """Rebuild the missing full profiles; the pools were already opened at startup."""
+    if _rewarm_tasks:
+        return
+    task = asyncio.create_task(warm_up(app, languages, requests=REWARM_REQUESTS, open_pools=False))
+    _rewarm_tasks.add(task)
+    task.add_done_callback(_rewarm_tasks.discard)
+
+
+async def _check_migrations() -> CheckResult:
+    """The primary database is at the migration head of this code."""
+    expected = set(ScriptDirectory(str(ALEMBIC_DIR)).get_heads())
+    try:
+        async with engine.connect() as connection:
+            current = set(
+                await connection.run_sync(
+                    lambda sync: MigrationContext.configure(sync).get_current_heads()
+                )
+            )
+    except (DBAPIError, PoolTimeoutError, OSError) as exc:
+        return CheckResult(ok=False, detail=f"database unavailable: {exc}")
+    if current != expected:
+        return CheckResult(
+            ok=False,
+            detail=f"database at {', '.join(sorted(current)) or 'no revision'}, "
+            f"code expects {', '.join(sorted(expected))}",
+        )
+    return CheckResult(ok=True, detail=f"at head {', '.join(sorted(expected))}")
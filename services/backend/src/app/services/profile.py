@@ -0,0 +1,284 @@
+"""Loading and localization of profile content."""
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import Select, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
+
+from app.config import settings
+from app.core.conditional import latest_timestamp
+from app.models.contact import Contact
+from app.models.project import Project
+from app.models.resume import Resume
+from app.models.stack import Stack
+from app.models.testimonial import Testimonial
+from app.models.work_experience import WorkExperience
+from app.schemas.profile import (
+    LocalizedContactRead,
+    LocalizedProjectRead,
+    LocalizedTestimonialRead,
+    LocalizedWorkExperienceRead,
+    ProfileFullRead,
+    ResumeRead,
+    StackRead,
+)
+from app.services.profile_aggregate import (
+    SUPPORTED_DIALECTS,
+    best_translation_id,
+    fetch_full_profile,
+)
+
+
+def with_preferred_translation(
+    statement: Select[Any], relationship: InstrumentedAttribute[Any], lang: str
+) -> Select[Any]:
+    """
+    Eager-load only the preferred translation (lang -> en -> first) of each row.
+    The fallback is resolved in the selectin query, so other languages are never fetched;
+    `populate_existing` keeps rows already in the identity map from serving full collections.
+    """
+    translation = relationship.property.mapper.class_
+    (parent_fk,) = relationship.property.remote_side
+    preferred = best_translation_id(
+        translation, parent_fk.key, getattr(translation, parent_fk.key), lang
+    )
+    return statement.options(
+        selectinload(relationship.and_(translation.id == preferred))
+    ).execution_options(populate_existing=True)
+
+
+async def load_full_profile(
+    db: AsyncSession, session_factory: async_sessionmaker[AsyncSession], lang: str
+) -> tuple[ProfileFullRead, datetime | None]:
+    """Load the localized profile and its modification time with the configured loader."""
+    dialect = db.get_bind().dialect.name
+    if settings.PROFILE_FULL_LOADER == "aggregate" and dialect in SUPPORTED_DIALECTS:
+        return await fetch_full_profile(db, lang)
+    # SQLite serializes everything on one connection, so there is nothing to overlap
+    return await load_full_profile_orm(db, session_factory, lang, concurrent=dialect != "sqlite")
+
+
+async def load_full_profile_orm(
+    db: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    lang: str,
+    *,
+    concurrent: bool,
+) -> tuple[ProfileFullRead, datetime | None]:
+    """
+    One ORM query per section, localized in Python.
+    With `concurrent`, each section runs on its own pooled session so the load
+    takes about as long as the slowest section instead of the sum of all six.
+    """
+    statements: tuple[Select[Any], ...] = (
+        select(WorkExperience).order_by(WorkExperience.start_date.desc()),
+        select(Project).order_by(Project.is_featured.desc(), Project.start_date.desc()),
+        select(Stack).order_by(Stack.name),
+        select(Testimonial).order_by(Testimonial.date.desc()),
+        select(Contact).where(Contact.is_visible).order_by(Contact.sort_order),
+        select(Resume).where(Resume.is_active).order_by(Resume.language_code),
+    )
+    if concurrent:
+        sections = await asyncio.gather(
+            *(_load_section(session_factory, statement) for statement in statements)
+        )
+    else:
+        sections = [(await db.execute(statement)).scalars().all() for statement in statements]
+    (
+        work_experience_rows,
+        project_rows,
+        stack_rows,
+        testimonial_rows,
+        contact_rows,
+        resume_rows,
+    ) = sections
+
+    stacks = StackInterner()
+    profile = ProfileFullRead(
+        stacks=[stacks(entry) for entry in stack_rows],
+        experience=[
+            serialize_work_experience(entry, lang, stacks) for entry in work_experience_rows
+        ],
+        projects=[serialize_project(entry, lang, stacks) for entry in project_rows],
+        testimonials=[serialize_testimonial(entry, lang) for entry in testimonial_rows],
+        contacts=[serialize_contact(entry, lang) for entry in contact_rows],
+        resumes=[ResumeRead.model_validate(entry) for entry in resume_rows],
+    )
+    rows = (row for section in sections for row in section)
+    return profile, latest_timestamp(modified_at(row) for row in rows)
+
+
+def compact_profile(profile: ProfileFullRead) -> dict[str, Any]:
+    """
+    Normalized form of the profile: stacks are listed once and entries refer to them
+    by position in `stacks`; null fields are dropped and dates are ISO strings.
+    """
+    positions = {stack.id: position for position, stack in enumerate(profile.stacks)}
+    linked = {"__all__": {"stacks"}}
+    document = profile.model_dump(
+        mode="json", exclude_none=True, exclude={"experience": linked, "projects": linked}
+    )
+    entries: list[LocalizedWorkExperienceRead | LocalizedProjectRead] = [
+        *profile.experience,
+        *profile.projects,
+    ]
+    compact_entries = [*document["experience"], *document["projects"]]
+    for compact, entry in zip(compact_entries, entries, strict=True):
+        compact["stacks"] = [positions[stack.id] for stack in entry.stacks]
+    return document
+
+
+async def _load_section(
+    session_factory: async_sessionmaker[AsyncSession], statement: Select[Any]
+) -> Sequence[Any]:
+    """Run one section query on a dedicated session; relationships load eagerly (selectin)."""
+    async with session_factory() as session:
+        result = await session.execute(statement)
+        return result.scalars().all()
+
+
+def modified_at(row: Any) -> datetime | None:
+    """
+    Row modification time: `updated_at` from TimestampMixin, `generated_at` for resumes.
+    Stacks embedded in the row (when loaded) count too, since editing a stack
+    does not touch the rows that link it.
+    """
+    if isinstance(row, Resume):
+        return row.generated_at
+    stacks = inspect(row).dict.get("stacks", ())
+    return latest_timestamp(
+        (cast(datetime | None, getattr(row, "updated_at", None)), *(s.updated_at for s in stacks))
+    )
+
+
+async def latest_modification(db: AsyncSession) -> datetime | None:
+    """Most recent modification of any profile content, from the row timestamps."""
+    columns = (
+        *(model.updated_at for model in (Stack, WorkExperience, Project, Testimonial, Contact)),
+        Resume.generated_at,
+    )
+    result = await db.execute(select(*(select(func.max(c)).scalar_subquery() for c in columns)))
+    return latest_timestamp(result.one())
+
+
+def content_tables(*models: type[Any]) -> frozenset[str]:
+    """Tables the payload of `models` is built from: their own and their relationships'."""
+    tables: set[str] = set()
+    for model in models:
+        mapper = inspect(model)
+        tables.add(mapper.local_table.name)
+        tables.update(relationship.mapper.local_table.name for relationship in mapper.relationships)
+    return frozenset(tables)
+
+
+class TranslationIndex:
+    """
+    An entity's translations keyed by language code, built in one pass.
+    The lang -> en -> first fallback target is resolved up front, so lookups are O(1).
+    "First" is the lowest language code, as in `best_translation_id`, so the result
+    does not depend on the order the collection was loaded in.
+    The serializers build one per call: every load serializes each entity once, for one
+    language, so an index could not be reused anyway. Building it is a single pass over
+    the few published languages, and its results are cached with the snapshots.
+    """
+
+    __slots__ = ("_by_language", "_fallback")
+
+    def __init__(self, translations: Sequence[Any]) -> None:
+        self._by_language: dict[str, Any] = {}
+        for translation in translations:
+            self._by_language.setdefault(translation.language_code, translation)
+        first = self._by_language[min(self._by_language)] if self._by_language else None
+        self._fallback = self._by_language.get("en", first)
+
+    def get(self, lang: str) -> Any | None:
+        """Translation for `lang`, falling back to en, then to the first one."""
+        return self._by_language.get(lang, self._fallback)
+
+
+class StackInterner:
+    """
+    Validates each stack once per snapshot; every section then shares the same `StackRead`.
+    Keyed by id, so rows loaded by different sessions still intern to one object.
+    """
+
+    __slots__ = ("_by_id",)
+
+    def __init__(self) -> None:
+        self._by_id: dict[UUID, StackRead] = {}
+
+    def __call__(self, stack: Stack) -> StackRead:
+        read = self._by_id.get(stack.id)
+        if read is None:
+            read = self._by_id[stack.id] = StackRead.model_validate(stack)
+        return read
+
+
+def serialize_work_experience(
+    entry: WorkExperience, lang: str, stacks: StackInterner | None = None
+) -> LocalizedWorkExperienceRead:
+    translation = TranslationIndex(entry.translations).get(lang)
+    intern = stacks or StackInterner()
+    return LocalizedWorkExperienceRead(
+        id=entry.id,
+        company_name=entry.company_name,
+        company_url=entry.company_url,
+        start_date=entry.start_date,
+        end_date=entry.end_date,
+        is_current=entry.is_current,
+        position=translation.position if translation else "",
+        description=translation.description if translation else "",
+        location=translation.location if translation else None,
+        stacks=[intern(stack) for stack in entry.stacks],
+    )
+
+
+def serialize_project(
+    entry: Project, lang: str, stacks: StackInterner | None = None
+) -> LocalizedProjectRead:
+    translation = TranslationIndex(entry.translations).get(lang)
+    intern = stacks or StackInterner()
+    return LocalizedProjectRead(
+        id=entry.id,
+        slug=entry.slug,
+        link=entry.link,
+        repo_link=entry.repo_link,
+        start_date=entry.start_date,
+        end_date=entry.end_date,
+        is_featured=entry.is_featured,
+        title=translation.title if translation else "",
+        description=translation.description if translation else "",
+        role=translation.role if translation else None,
+        stacks=[intern(stack) for stack in entry.stacks],
+    )
+
+
+def serialize_testimonial(entry: Testimonial, lang: str) -> LocalizedTestimonialRead:
+    translation = TranslationIndex(entry.translations).get(lang)
+    return LocalizedTestimonialRead(
+        id=entry.id,
+        author_name=entry.author_name,
+        author_url=entry.author_url,
+        author_avatar_url=entry.author_avatar_url,
+        kind=entry.kind,
+        date=entry.date,
+        author_position=translation.author_position if translation else None,
+        content=translation.content if translation else "",
+    )
+
+
+def serialize_contact(entry: Contact, lang: str) -> LocalizedContactRead:
+    translation = TranslationIndex(entry.translations).get(lang)
+    return LocalizedContactRead(
+        id=entry.id,
+        type=entry.type,
+        value=entry.value,
+        icon=entry.icon,
+        sort_order=entry.sort_order,
+        label=translation.label if translation else None,
+    )
@@ -0,0 +1,261 @@
+"""Single-statement loader for the localized full profile.
+
+The whole `ProfileFullRead` document is assembled by the database as JSON, so
+a request costs one round trip instead of a query per section and relationship.
+PostgreSQL uses `jsonb_build_object` / `jsonb_agg`; SQLite uses the JSON1
+equivalents. Translation fallback (lang -> en -> first) is resolved in SQL.
+Entries reference their stacks by id, and each stack is validated only once.
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, ColumnElement, ScalarSelect, Select, case, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from app.core.conditional import latest_timestamp
+from app.models.contact import Contact, ContactTranslation
+from app.models.project import Project, ProjectTranslation, project_stacks
+from app.models.resume import Resume
+from app.models.stack import Stack
+from app.models.testimonial import Testimonial, TestimonialTranslation
+from app.models.work_experience import (
+    WorkExperience,
+    WorkExperienceTranslation,
+    work_experience_stacks,
+)
+from app.schemas.profile import ProfileFullRead, StackRead
+
+SUPPORTED_DIALECTS = frozenset({"postgresql", "sqlite"})
+
+
+def translation_rank(language_code: InstrumentedAttribute[str], lang: str) -> ColumnElement[int]:
+    """Sort key implementing the lang -> en -> first fallback."""
+    return case((language_code == lang, 0), (language_code == "en", 1), else_=2)
+
+
+def best_translation_id(
+    translation_model: Any, parent_fk: str, parent_id: InstrumentedAttribute[Any], lang: str
+) -> ScalarSelect[Any]:
+    """Correlated subquery selecting the id of the preferred translation for a parent row."""
+    candidate = aliased(translation_model)
+    return (
+        select(candidate.id)
+        .where(getattr(candidate, parent_fk) == parent_id)
+        .order_by(translation_rank(candidate.language_code, lang), candidate.language_code)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+class _JsonBuilder:
+    """Dialect-specific JSON construction functions."""
+
+    def __init__(self, dialect: str) -> None:
+        self.postgres = dialect == "postgresql"
+
+    def object(self, **fields: Any) -> ColumnElement[Any]:
+        args: list[Any] = []
+        for key, value in fields.items():
+            args.extend((literal_column(f"'{key}'"), value))
+        if self.postgres:
+            return func.jsonb_build_object(*args, type_=JSON)
+        return func.json_object(*args, type_=JSON)
+
+    def nested(self, document: ScalarSelect[Any]) -> ColumnElement[Any]:
+        """Embed a JSON subquery result as JSON rather than as a string."""
+        if self.postgres:
+            return document
+        return func.json(document)
+
+    def array(
+        self,
+        document: ColumnElement[Any],
+        statement: Select[Any],
+        order_by: tuple[ColumnElement[Any] | InstrumentedAttribute[Any], ...],
+    ) -> ScalarSelect[Any]:
+        """Aggregate `document` over the rows of `statement` into an ordered JSON array."""
+        if self.postgres:
+            aggregate = func.jsonb_agg(aggregate_order_by(document, *order_by))
+            return statement.with_only_columns(
+                func.coalesce(aggregate, literal_column("'[]'::jsonb")),
+                maintain_column_froms=True,
+            ).scalar_subquery()
+        rows = statement.with_only_columns(
+            document.label("doc"), maintain_column_froms=True
+        ).order_by(*order_by)
+        ordered = rows.subquery()
+        return select(func.json_group_array(func.json(ordered.c.doc))).scalar_subquery()
+
+
+def build_full_profile_statement(dialect: str, lang: str) -> Select[Any]:
+    """Statement returning the localized profile as a single JSON document."""
+    json_ = _JsonBuilder(dialect)
+
+    def stack_document(model: type[Stack] | Any) -> ColumnElement[Any]:
+        return json_.object(
+            id=model.id,
+            name=model.name,
+            icon_url=model.icon_url,
+            category=model.category,
+            proficiency=model.proficiency,
+        )
+
+    def linked_stacks(association: Any, fk: str, parent_id: Any) -> ColumnElement[Any]:
+        linked = aliased(Stack)
+        statement = (
+            select(linked.id)
+            .join(association, association.c.stack_id == linked.id)
+            .where(association.c[fk] == parent_id)
+            .correlate_except(linked, association)
+        )
+        # Only ids: stack documents are sent once in the top-level list and shared
+        return json_.nested(json_.array(json_.object(id=linked.id), statement, (linked.name,)))
+
+    exp_t = aliased(WorkExperienceTranslation)
+    experience = json_.array(
+        json_.object(
+            id=WorkExperience.id,
+            company_name=WorkExperience.company_name,
+            company_url=WorkExperience.company_url,
+            start_date=WorkExperience.start_date,
+            end_date=WorkExperience.end_date,
+            is_current=WorkExperience.is_current,
+            position=func.coalesce(exp_t.position, ""),
+            description=func.coalesce(exp_t.description, ""),
+            location=exp_t.location,
+            stacks=linked_stacks(work_experience_stacks, "work_experience_id", WorkExperience.id),
+        ),
+        select(WorkExperience.id).outerjoin(
+            exp_t,
+            exp_t.id
+            == best_translation_id(
+                WorkExperienceTranslation, "work_experience_id", WorkExperience.id, lang
+            ),
+        ),
+        (WorkExperience.start_date.desc(),),
+    )
+
+    project_t = aliased(ProjectTranslation)
+    projects = json_.array(
+        json_.object(
+            id=Project.id,
+            slug=Project.slug,
+            link=Project.link,
+            repo_link=Project.repo_link,
+            start_date=Project.start_date,
+            end_date=Project.end_date,
+            is_featured=Project.is_featured,
+            title=func.coalesce(project_t.title, ""),
+            description=func.coalesce(project_t.description, ""),
+            role=project_t.role,
+            stacks=linked_stacks(project_stacks, "project_id", Project.id),
+        ),
+        select(Project.id).outerjoin(
+            project_t,
+            project_t.id == best_translation_id(ProjectTranslation, "project_id", Project.id, lang),
+        ),
+        (Project.is_featured.desc(), Project.start_date.desc()),
+    )
+
+    stacks = json_.array(stack_document(Stack), select(Stack.id), (Stack.name,))
+
+    testimonial_t = aliased(TestimonialTranslation)
+    testimonials = json_.array(
+        json_.object(
+            id=Testimonial.id,
+            author_name=Testimonial.author_name,
+            author_url=Testimonial.author_url,
+            author_avatar_url=Testimonial.author_avatar_url,
+            kind=Testimonial.kind,
+            date=Testimonial.date,
+            author_position=testimonial_t.author_position,
+            content=func.coalesce(testimonial_t.content, ""),
+        ),
+        select(Testimonial.id).outerjoin(
+            testimonial_t,
+            testimonial_t.id
+            == best_translation_id(TestimonialTranslation, "testimonial_id", Testimonial.id, lang),
+        ),
+        (Testimonial.date.desc(),),
+    )
+
+    contact_t = aliased(ContactTranslation)
+    contacts = json_.array(
+        json_.object(
+            id=Contact.id,
+            type=Contact.type,
+            value=Contact.value,
+            icon=Contact.icon,
+            sort_order=Contact.sort_order,
+            label=contact_t.label,
+        ),
+        select(Contact.id)
+        .outerjoin(
+            contact_t,
+            contact_t.id == best_translation_id(ContactTranslation, "contact_id", Contact.id, lang),
+        )
+        .where(Contact.is_visible),
+        (Contact.sort_order,),
+    )
+
+    resumes = json_.array(
+        json_.object(
+            id=Resume.id,
+            language_code=Resume.language_code,
+            file_path=Resume.file_path,
+            generated_at=Resume.generated_at,
+            is_active=Resume.is_active,
+        ),
+        select(Resume.id).where(Resume.is_active),
+        (Resume.language_code,),
+    )
+
+    modified = json_.object(
+        experience=select(func.max(WorkExperience.updated_at)).scalar_subquery(),
+        projects=select(func.max(Project.updated_at)).scalar_subquery(),
+        stacks=select(func.max(Stack.updated_at)).scalar_subquery(),
+        testimonials=select(func.max(Testimonial.updated_at)).scalar_subquery(),
+        contacts=select(func.max(Contact.updated_at)).where(Contact.is_visible).scalar_subquery(),
+        resumes=select(func.max(Resume.generated_at)).where(Resume.is_active).scalar_subquery(),
+    )
+
+    return select(
+        json_.object(
+            experience=json_.nested(experience),
+            projects=json_.nested(projects),
+            stacks=json_.nested(stacks),
+            testimonials=json_.nested(testimonials),
+            contacts=json_.nested(contacts),
+            resumes=json_.nested(resumes),
+            modified=modified,
+        )
+    )
+
+
+async def fetch_full_profile(
+    db: AsyncSession, lang: str
+) -> tuple[ProfileFullRead, datetime | None]:
+    """Load the localized profile and its last modification time in one round trip."""
+    statement = build_full_profile_statement(db.get_bind().dialect.name, lang)
+    document = (await db.execute(statement)).scalar_one()
+    if isinstance(document, str):
+        document = json.loads(document)
+    modified = document.pop("modified")
+    _share_stacks(document)
+    last_modified = latest_timestamp(
+        datetime.fromisoformat(value) for value in modified.values() if value is not None
+    )
+    return ProfileFullRead.model_validate(document), last_modified
+
+
+def _share_stacks(document: dict[str, Any]) -> None:
+    """Validate each stack once and substitute it for the id references in entries."""
+    stacks = {item["id"]: StackRead.model_validate(item) for item in document["stacks"]}
+    document["stacks"] = list(stacks.values())
+    for section in ("experience", "projects"):
+        for entry in document[section]:
+            entry["stacks"] = [stacks[item["id"]] for item in entry["stacks"]]
@@ -0,0 +1,306 @@
+"""Full-text search over translated profile content.
+
+PostgreSQL matches against the generated `search_vector` columns of the
+translation tables (GIN-indexed, english or russian text search configuration
+chosen by the row's language) and ranks with `ts_rank`. Other dialects use an
+in-memory inverted index built per language from the same `SEARCHABLE` columns
+and cached until content changes.
+
+Snippets are HTML-escaped, with matched words wrapped in <mark>.
+"""
+
+import bisect
+import html
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, cast, func, literal, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.config import settings
+from app.core.cache import SnapshotCache
+from app.models.project import Project, ProjectTranslation
+from app.models.testimonial import Testimonial, TestimonialTranslation
+from app.models.work_experience import WorkExperienceTranslation
+from app.schemas.search import SearchHit, SearchKind
+
+# Text search configuration per language; anything else is treated as English
+TEXT_SEARCH_CONFIGS = {"en": "english", "ru": "russian"}
+
+# Searchable text columns per translation model, most important first; the
+# search_vector columns of migration e2a4c6b8d0f3 are generated from the same list
+SEARCHABLE: dict[type[Any], tuple[InstrumentedAttribute[Any], ...]] = {
+    ProjectTranslation: (
+        ProjectTranslation.title,
+        ProjectTranslation.description,
+        ProjectTranslation.role,
+    ),
+    WorkExperienceTranslation: (
+        WorkExperienceTranslation.position,
+        WorkExperienceTranslation.description,
+        WorkExperienceTranslation.location,
+    ),
+    TestimonialTranslation: (
+        TestimonialTranslation.content,
+        TestimonialTranslation.author_position,
+    ),
+}
+
+# Highlight delimiters used until the snippet is escaped
+_START, _STOP = "\x02", "\x03"
+_HEADLINE_OPTIONS = f"StartSel={_START}, StopSel={_STOP}, MaxWords=30, MinWords=12"
+
+_WORD = re.compile(r"\w+")
+_SNIPPET_CONTEXT = 80
+_SNIPPET_LENGTH = 240
+
+
+def text_search_config(lang: str) -> str:
+    return TEXT_SEARCH_CONFIGS.get(lang, "english")
+
+
+async def search_profile(db: AsyncSession, query: str, lang: str, limit: int) -> list[SearchHit]:
+    """Ranked hits for `query` among the translations in `lang`."""
+    if not _WORD.search(query):
+        return []
+    if db.get_bind().dialect.name == "postgresql":
+        result = await db.execute(build_search_statement(query, lang, limit))
+        return [
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                slug=row.slug,
+                title=row.title,
+                snippet=render_snippet(row.snippet),
+                rank=row.rank,
+            )
+            for row in result
+        ]
+    index = await search_index_cache.get_or_build(lang, lambda: _build_index(db, lang))
+    return index.search(query, limit)
+
+
+def build_search_statement(query: str, lang: str, limit: int) -> Select[Any]:
+    """PostgreSQL statement ranking translation rows against `websearch_to_tsquery`."""
+    config = cast(literal(text_search_config(lang)), REGCONFIG)
+    tsquery = func.websearch_to_tsquery(config, query)
+
+    def matches(
+        kind: SearchKind,
+        translation: Any,
+        parent_id: Any,
+        slug: Any,
+        title: Any,
+        text: Any,
+    ) -> Select[Any]:
+        vector: ColumnElement[Any] = literal_column(f"{translation.__tablename__}.search_vector")
+        return select(
+            literal(kind).label("kind"),
+            parent_id.label("id"),
+            slug.label("slug"),
+            title.label("title"),
+            func.ts_headline(config, text, tsquery, _HEADLINE_OPTIONS).label("snippet"),
+            func.ts_rank(vector, tsquery).label("rank"),
+        ).where(translation.language_code == lang, vector.op("@@")(tsquery))
+
+    statements = [
+        matches(
+            "project",
+            ProjectTranslation,
+            ProjectTranslation.project_id,
+            Project.slug,
+            ProjectTranslation.title,
+            ProjectTranslation.description,
+        ).join(Project, Project.id == ProjectTranslation.project_id),
+        matches(
+            "experience",
+            WorkExperienceTranslation,
+            WorkExperienceTranslation.work_experience_id,
+            literal(None),
+            WorkExperienceTranslation.position,
+            WorkExperienceTranslation.description,
+        ),
+        matches(
+            "testimonial",
+            TestimonialTranslation,
+            TestimonialTranslation.testimonial_id,
+            literal(None),
+            Testimonial.author_name,
+            TestimonialTranslation.content,
+        ).join(Testimonial, Testimonial.id == TestimonialTranslation.testimonial_id),
+    ]
+    hits = union_all(*statements).subquery()
+    rank: ColumnElement[Any] = hits.c.rank
+    return select(hits).order_by(rank.desc(), hits.c.title).limit(limit)
+
+
+def render_snippet(marked: str) -> str:
+    """Escape a snippet and turn the highlight delimiters into <mark> tags."""
+    escaped = html.escape(marked, quote=False)
+    return escaped.replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """A hit candidate: `text` is shown in the snippet, `fields` are what is indexed."""
+
+    kind: SearchKind
+    id: Any
+    slug: str | None
+    title: str
+    text: str
+    fields: tuple[str | None, ...]
+
+
+class InMemorySearchIndex:
+    """
+    Inverted index over search documents: term -> {document: term frequency}.
+    Query words match terms by prefix (a cheap stand-in for stemming); every word
+    has to match. Hits are ranked by tf-idf.
+    """
+
+    def __init__(self, documents: Iterable[SearchDocument]) -> None:
+        self.documents = list(documents)
+        self._postings: dict[str, dict[int, int]] = {}
+        for position, document in enumerate(self.documents):
+            counts = Counter(_tokens(" ".join(filter(None, document.fields))))
+            for term, count in counts.items():
+                self._postings.setdefault(term, {})[position] = count
+        self._terms = sorted(self._postings)
+
+    def search(self, query: str, limit: int) -> list[SearchHit]:
+        words = list(dict.fromkeys(_tokens(query)))
+        if not words:
+            return []
+        scores: dict[int, float] | None = None
+        for word in words:
+            word_scores: dict[int, float] = {}
+            for term in self._expand(word):
+                postings = self._postings[term]
+                idf = math.log(1 + len(self.documents) / len(postings))
+                for position, count in postings.items():
+                    word_scores[position] = word_scores.get(position, 0.0) + count * idf
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    position: score + word_scores[position]
+                    for position, score in scores.items()
+                    if position in word_scores
+                }
+            if not scores:
+                return []
+
+        assert scores is not None
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.documents[item[0]].title))
+        hits = []
+        for position, score in ranked[:limit]:
+            document = self.documents[position]
+            hits.append(
+                SearchHit(
+                    kind=document.kind,
+                    id=document.id,
+                    slug=document.slug,
+                    title=document.title,
+                    snippet=render_snippet(_mark(document.text, tuple(words))),
+                    rank=round(score, 6),
+                )
+            )
+        return hits
+
+    def _expand(self, word: str) -> list[str]:
+        """Index terms starting with `word`."""
+        start = bisect.bisect_left(self._terms, word)
+        terms = []
+        for term in self._terms[start:]:
+            if not term.startswith(word):
+                break
+            terms.append(term)
+        return terms
+
+
+# Per-language in-memory indexes for databases without native full-text search
+search_index_cache: SnapshotCache[InMemorySearchIndex] = SnapshotCache(
+    ttl=settings.PROFILE_CACHE_TTL
+)
+
+
+async def _build_index(db: AsyncSession, lang: str) -> InMemorySearchIndex:
+    projects = await db.execute(
+        select(
+            Project.id,
+            Project.slug,
+            ProjectTranslation.title,
+            ProjectTranslation.description,
+            *SEARCHABLE[ProjectTranslation],
+        )
+        .join(ProjectTranslation, ProjectTranslation.project_id == Project.id)
+        .where(ProjectTranslation.language_code == lang)
+    )
+    experience = await db.execute(
+        select(
+            WorkExperienceTranslation.work_experience_id,
+            WorkExperienceTranslation.position,
+            WorkExperienceTranslation.description,
+            *SEARCHABLE[WorkExperienceTranslation],
+        ).where(WorkExperienceTranslation.language_code == lang)
+    )
+    testimonials = await db.execute(
+        select(
+            Testimonial.id,
+            Testimonial.author_name,
+            TestimonialTranslation.content,
+            *SEARCHABLE[TestimonialTranslation],
+        )
+        .join(TestimonialTranslation, TestimonialTranslation.testimonial_id == Testimonial.id)
+        .where(TestimonialTranslation.language_code == lang)
+    )
+    documents = [
+        *(
+            SearchDocument("project", row[0], row[1], row[2], row[3], row[4:])
+            for row in projects.tuples()
+        ),
+        *(
+            SearchDocument("experience", row[0], None, row[1], row[2], row[3:])
+            for row in experience.tuples()
+        ),
+        *(
+            SearchDocument("testimonial", row[0], None, row[1], row[2], row[3:])
+            for row in testimonials.tuples()
+        ),
+    ]
+    return InMemorySearchIndex(documents)
+
+
+def _tokens(text: str) -> list[str]:
+    return [word.lower() for word in _WORD.findall(text)]
+
+
+def _mark(text: str, words: tuple[str, ...]) -> str:
+    """Excerpt around the first match, with matched words between highlight delimiters."""
+    matches = [m for m in _WORD.finditer(text) if m.group().lower().startswith(words)]
+    start = 0
+    if matches:
+        start = max(0, matches[0].start() - _SNIPPET_CONTEXT)
+        boundary = text.rfind(" ", 0, start + 1) if start else 0
+        start = boundary + 1 if boundary > 0 else start
+    end = min(len(text), start + _SNIPPET_LENGTH)
+    parts = ["…" if start else ""]
+    cursor = start
+    for match in matches:
+        if match.start() < start:
+            continue
+        if match.end() > end:
+            break
+        parts.extend((text[cursor : match.start()], _START, match.group(), _STOP))
+        cursor = match.end()
+    parts.append(text[cursor:end])
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
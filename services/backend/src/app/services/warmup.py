@@ -0,0 +1,112 @@
+"""Startup warm-up of the database pools and the profile caches.
+
+The profile endpoints are requested in-process for every language in
+`PROFILE_LANGUAGES`, exactly as the site requests them. That compiles each
+statement into SQLAlchemy's compiled cache, prepares it on an asyncpg
+connection and stores the serialized snapshots in the profile caches, so the
+first real request after a deploy is served from memory.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.types import ASGIApp, Message
+
+from app.config import settings
+from app.database import open_pool_connections
+
+logger = logging.getLogger(__name__)
+
+# Profile endpoints and their query strings, `{lang}` filled per language
+WARM_UP_REQUESTS: tuple[tuple[str, str], ...] = (
+    ("/full", "lang={lang}"),
+    ("/full", "lang={lang}&format=compact"),
+    ("/experience", "lang={lang}"),
+    ("/projects", "lang={lang}"),
+    ("/testimonials", "lang={lang}"),
+    ("/contacts", "lang={lang}"),
+    ("/stacks", ""),
+    ("/resume", ""),
+)
+
+
+@dataclass
+class WarmUpState:
+    """Outcome of the last warm-up."""
+
+    completed: bool = False
+    seconds: float | None = None
+    failures: list[str] = field(default_factory=list)
+
+
+warm_up_state = WarmUpState()
+
+
+async def warm_up(
+    app: ASGIApp,
+    languages: Sequence[str] | None = None,
+    *,
+    requests: Sequence[tuple[str, str]] = WARM_UP_REQUESTS,
+    open_pools: bool = True,
+) -> WarmUpState:
+    """
+    Open the pools, then request every profile endpoint once per language.
+    `completed` keeps its previous value while a warm-up runs, so refilling
+    already warm caches does not mark the worker cold in the meantime.
+    """
+    started = time.perf_counter()
+    state = warm_up_state
+    state.failures = []
+    try:
+        if open_pools:
+            await open_pool_connections()
+        targets = dict.fromkeys(
+            (f"{settings.API_V1_STR}/profile{path}", query.format(lang=lang))
+            for lang in languages or settings.PROFILE_LANGUAGES
+            for path, query in requests
+        )
+        for path, query in targets:
+            status = await _get(app, path, query)
+            if status != 200:
+                state.failures.append(f"{path}?{query}: {status}")
+    except Exception as exc:
+        # The caches still fill lazily on the first requests
+        logger.exception("Warm-up failed")
+        state.failures.append(repr(exc))
+    state.completed = not state.failures
+    state.seconds = time.perf_counter() - started
+    logger.info("Warm-up finished in %.2fs with %d failures", state.seconds, len(state.failures))
+    return state
+
+
+async def _get(app: ASGIApp, path: str, query: str) -> int:
+    """Run a GET request through the ASGI app and return its status code."""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"warm-up")],
+        "client": None,
+        "server": ("warm-up", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
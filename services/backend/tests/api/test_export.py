@@ -0,0 +1,65 @@
+import json
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.contact import Contact, ContactTranslation
+from app.models.project import Project, ProjectTranslation
+from app.models.stack import Stack
+from app.models.work_experience import WorkExperience
+from app.schemas.exchange import ExchangeRecord
+from app.services.exchange import export_ndjson
+
+EXPORT_URL = "/api/v1/profile/export.ndjson"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_export_requires_admin(client: AsyncClient) -> None:
+    response = await client.get(EXPORT_URL)
+    assert response.status_code == 401
+
+    response = await client.get(EXPORT_URL, auth=("admin", "wrong"))
+    assert response.status_code == 401
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_export_streams_every_entity(client: AsyncClient, db: AsyncSession) -> None:
+    python = Stack(name="Python")
+    project = Project(slug="site", start_date=date(2024, 1, 1), stacks=[python])
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    contact = Contact(type="email", value="me@example.com")
+    contact.translations = [ContactTranslation(language_code="en", label="Email")]
+    db.add_all([project, contact, WorkExperience(company_name="Corp", start_date=date(2020, 1, 1))])
+    await db.commit()
+
+    response = await client.get(EXPORT_URL, auth=("admin", "test"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["entity"] for line in lines] == ["stack", "work_experience", "project", "contact"]
+    assert lines[2]["stacks"] == ["Python"]
+    assert lines[2]["translations"][0]["title"] == "Site"
+    assert lines[3]["type"] == "email"
+    adapter: TypeAdapter[ExchangeRecord] = TypeAdapter(ExchangeRecord)
+    for line in lines:
+        adapter.validate_python(line)
+
+
+@pytest.mark.unit
+async def test_export_yields_one_chunk_per_partition(db: AsyncSession) -> None:
+    db.add_all([Stack(name=f"Stack {i}") for i in range(5)])
+    await db.commit()
+
+    chunks = [
+        chunk async for chunk in export_ndjson(async_sessionmaker(bind=db.bind), batch_size=2)
+    ]
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
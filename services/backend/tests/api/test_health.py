@@ -1,7 +1,24 @@
+import asyncio
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
+from app.api.v1.profile import profile_cache
 from app.config import settings
+from app.core.cache import invalidate_all
+from app.services import health, warmup
+from app.services.health import CheckResult
+
+
+@pytest.fixture(autouse=True)
+def clear_probes():
+    """Probe results and the warm-up outcome outlive content invalidation; reset them per test."""
+    health._probes.invalidate()
+    warmup.warm_up_state.completed = False
+    yield
+    health._probes.invalidate()
+    warmup.warm_up_state.completed = False
 
 
 @pytest.mark.unit
@@ -14,3 +31,107 @@ async def test_health_check(client: AsyncClient):
     assert data["version"] == "0.1.0"
     assert data["environment"] == settings.ENVIRONMENT
     assert data["project_name"] == settings.PROJECT_NAME
+
+
+@pytest.mark.unit
+async def test_pool_health_lists_every_engine(client: AsyncClient):
+    """Test pool status endpoint."""
+    response = await client.get("/api/health/pool")
+    assert response.status_code == 200
+    assert "primary" in response.json()["pools"]
+
+
+@pytest.mark.unit
+async def test_liveness(client: AsyncClient):
+    """Test liveness endpoint."""
+    response = await client.get("/api/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.unit
+async def test_readiness_when_every_check_passes(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test readiness with the database at the migration head, once the cache is warm."""
+
+    async def at_head() -> CheckResult:
+        return CheckResult(ok=True, detail="at head")
+
+    monkeypatch.setattr(health, "_check_migrations", at_head)
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    cache = response.json()["checks"]["cache"]
+    assert cache == {"ok": False, "detail": f"not cached: {', '.join(settings.PROFILE_LANGUAGES)}"}
+
+    # The probe only starts the warm-up; the next probe sees its result
+    await asyncio.gather(*health._rewarm_tasks)
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["checks"]["cache"] == {"ok": True, "detail": "warm"}
+    assert set(data["checks"]) == {"pool", "cache", "migrations"}
+
+
+@pytest.mark.unit
+async def test_readiness_survives_cache_invalidation_after_warm_up(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a warmed-up worker stays ready and refills only the full profiles."""
+
+    async def at_head() -> CheckResult:
+        return CheckResult(ok=True, detail="at head")
+
+    async def no_pools() -> None:
+        raise AssertionError("pools are opened at startup only")
+
+    monkeypatch.setattr(health, "_check_migrations", at_head)
+    monkeypatch.setattr(warmup, "open_pool_connections", no_pools)
+    warmup.warm_up_state.completed = True
+
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 200
+    languages = ", ".join(settings.PROFILE_LANGUAGES)
+    assert response.json()["checks"]["cache"] == {
+        "ok": True,
+        "detail": f"warmed up, refilling: {languages}",
+    }
+
+    await asyncio.gather(*health._rewarm_tasks)
+    assert warmup.warm_up_state.completed
+    assert len(profile_cache) == len(settings.PROFILE_LANGUAGES)
+    assert all(profile_cache.get(("full", lang)) for lang in settings.PROFILE_LANGUAGES)
+
+    invalidate_all()
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 200
+
+
+@pytest.mark.unit
+async def test_readiness_fails_without_migrations(client: AsyncClient):
+    """Test readiness against a database that was never migrated."""
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "not_ready"
+    assert data["checks"]["migrations"]["ok"] is False
+    assert "no revision" in data["checks"]["migrations"]["detail"]
+
+
+@pytest.mark.unit
+async def test_readiness_reports_pool_timeout_as_not_ready(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test readiness when no pooled connection becomes free in time."""
+
+    class ExhaustedEngine:
+        def connect(self):
+            raise PoolTimeoutError("QueuePool limit reached")
+
+    monkeypatch.setattr(health, "engine", ExhaustedEngine())
+    response = await client.get("/api/health/ready")
+    assert response.status_code == 503
+    migrations = response.json()["checks"]["migrations"]
+    assert migrations["ok"] is False
+    assert migrations["detail"].startswith("database unavailable")
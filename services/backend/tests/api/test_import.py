@@ -0,0 +1,167 @@
+import json
+import uuid
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.project import Project, ProjectTranslation
+from app.models.stack import Stack, StackUsage
+from app.models.work_experience import WorkExperience
+from app.services.exchange import import_ndjson
+
+IMPORT_URL = "/api/v1/profile/import"
+EXPORT_URL = "/api/v1/profile/export.ndjson"
+ADMIN = ("admin", "test")
+
+
+def _ndjson(*records: dict[str, object]) -> bytes:
+    return b"".join(json.dumps(record).encode() + b"\n" for record in records)
+
+
+def _project(title: str, *, lang: str = "en", stacks: list[str] | None = None) -> dict[str, object]:
+    return {
+        "entity": "project",
+        "slug": "site",
+        "start_date": "2024-01-01",
+        "stacks": stacks or [],
+        "translations": [{"language_code": lang, "title": title, "description": "Personal site"}],
+    }
+
+
+async def _count(db: AsyncSession, model: type[object]) -> int:
+    return (await db.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_requires_admin(client: AsyncClient) -> None:
+    response = await client.post(IMPORT_URL, content=b"")
+    assert response.status_code == 401
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_export_import_round_trip_is_idempotent(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    python = Stack(name="Python")
+    project = Project(slug="site", start_date=date(2024, 1, 1), stacks=[python])
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    experience = WorkExperience(company_name="Corp", start_date=date(2020, 1, 1), stacks=[python])
+    db.add_all([project, experience])
+    await db.commit()
+    exported = (await client.get(EXPORT_URL, auth=ADMIN)).content
+
+    response = await client.post(IMPORT_URL, content=exported, auth=ADMIN)
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": {"stack": 1, "work_experience": 1, "project": 1}}
+    assert await _count(db, Stack) == 1
+    assert await _count(db, Project) == 1
+    assert await _count(db, ProjectTranslation) == 1
+    assert (await client.get(EXPORT_URL, auth=ADMIN)).content == exported
+    usage = (await db.execute(select(StackUsage))).scalar_one()
+    assert (usage.project_count, usage.experience_count) == (1, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_upserts_by_natural_key(client: AsyncClient, db: AsyncSession) -> None:
+    body = _ndjson({"entity": "stack", "name": "Python"}, _project("Site", stacks=["Python"]))
+    assert (await client.post(IMPORT_URL, content=body, auth=ADMIN)).status_code == 200
+
+    body = _ndjson(
+        {"entity": "stack", "name": "Python", "category": "language"},
+        {"entity": "stack", "name": "Go"},
+        _project("Сайт", lang="ru", stacks=["Go"]),
+    )
+    response = await client.post(IMPORT_URL, content=body, auth=ADMIN)
+
+    assert response.status_code == 200
+    db.expire_all()
+    project = (
+        await db.execute(
+            select(Project).options(
+                selectinload(Project.translations), selectinload(Project.stacks)
+            )
+        )
+    ).scalar_one()
+    # The record replaces the project's translations and stacks
+    assert [(t.language_code, t.title) for t in project.translations] == [("ru", "Сайт")]
+    assert [stack.name for stack in project.stacks] == ["Go"]
+    python = (await db.execute(select(Stack).where(Stack.name == "Python"))).scalar_one()
+    assert python.category == "language"
+    usage = {
+        row.stack_id: row.project_count for row in (await db.execute(select(StackUsage))).scalars()
+    }
+    assert usage[python.id] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalid_line_rolls_back_everything(client: AsyncClient, db: AsyncSession) -> None:
+    body = _ndjson({"entity": "stack", "name": "Python"}) + b'{"entity": "project"}\n'
+
+    response = await client.post(IMPORT_URL, content=body, auth=ADMIN)
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Line 2: project.slug:")
+    assert await _count(db, Stack) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalid_json_is_reported_without_location(client: AsyncClient) -> None:
+    response = await client.post(IMPORT_URL, content=b"{not json\n", auth=ADMIN)
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Line 1: Invalid JSON")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unknown_stack_rolls_back_everything(client: AsyncClient, db: AsyncSession) -> None:
+    body = _ndjson({"entity": "stack", "name": "Python"}, _project("Site", stacks=["Rust"]))
+
+    response = await client.post(IMPORT_URL, content=body, auth=ADMIN)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown stacks: Rust"
+    assert await _count(db, Stack) == 0
+    assert await _count(db, Project) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_import_batches_and_splits_lines_across_chunks(db: AsyncSession) -> None:
+    ids = [str(uuid.uuid4()) for _ in range(5)]
+    body = _ndjson(
+        *(
+            {
+                "entity": "work_experience",
+                "id": id_,
+                "company_name": f"Corp {i}",
+                "start_date": "2020-01-01",
+            }
+            for i, id_ in enumerate([ids[0], *ids])
+        ),
+    )
+    # The first two lines share a key and land in one batch: the last record wins
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    imported = await import_ndjson(db, chunks(), batch_size=2)
+
+    assert imported == {"work_experience": 5}
+    assert await _count(db, WorkExperience) == 5
+    renamed = await db.get(WorkExperience, uuid.UUID(ids[0]), populate_existing=True)
+    assert renamed is not None and renamed.company_name == "Corp 1"
@@ -1,10 +1,15 @@
-from datetime import date
+from datetime import UTC, date, datetime
 
 import pytest
+from fastapi.routing import APIRoute
 from httpx import AsyncClient
+from sqlalchemy import event, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.profile import PROFILE_CACHE_MAX_AGE
+from app.api.v1.profile import PROFILE_CACHE_MAX_AGE, profile_cache, router
+from app.core.cache import invalidate_all
+from app.core.conditional import change_clock
+from app.database import get_db
 from app.models.contact import Contact, ContactTranslation
 from app.models.project import Project, ProjectTranslation
 from app.models.resume import Resume
@@ -235,3 +240,524 @@ async def test_get_full_profile_localized(client: AsyncClient, db: AsyncSession)
     assert payload["testimonials"][0]["content"] == "Отзыв"
     assert payload["contacts"][0]["label"] == "Почта"
     assert payload["resumes"][0]["language_code"] == "ru"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_full_profile_served_from_cache_until_write(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    contact = Contact(type="email", value="old@example.com", is_visible=True)
+    db.add(contact)
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/full?lang=en")
+    assert response.json()["contacts"][0]["value"] == "old@example.com"
+    assert profile_cache.get(("full", "en")) is not None
+
+    contact.value = "new@example.com"
+    await db.commit()
+    assert profile_cache.get(("full", "en")) is None
+
+    response = await client.get("/api/v1/profile/full?lang=en")
+    assert response.json()["contacts"][0]["value"] == "new@example.com"
+
+
+PROFILE_ENDPOINTS = [
+    "/api/v1/profile/experience",
+    "/api/v1/profile/projects",
+    "/api/v1/profile/stacks",
+    "/api/v1/profile/testimonials",
+    "/api/v1/profile/contacts",
+    "/api/v1/profile/resume",
+    "/api/v1/profile/full?lang=en",
+]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", PROFILE_ENDPOINTS)
+async def test_profile_endpoints_answer_if_none_match_with_304(
+    client: AsyncClient, db: AsyncSession, url: str
+) -> None:
+    db.add(Stack(name="Python"))
+    db.add(Contact(type="email", value="test@example.com", is_visible=True))
+    db.add(Resume(language_code="en", file_path="/tmp/cv.pdf", is_active=True))
+    await db.commit()
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers.get("cache-control") == EXPECTED_CACHE_CONTROL
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profile_if_modified_since(client: AsyncClient, db: AsyncSession) -> None:
+    db.add(Stack(name="Python"))
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/stacks")
+    last_modified = response.headers["last-modified"]
+
+    response = await client.get(
+        "/api/v1/profile/stacks", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    response = await client.get(
+        "/api/v1/profile/stacks",
+        headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"},
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_last_modified_follows_translation_and_stack_changes(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    stale = "Thu, 01 Jan 2015 00:00:00 GMT"
+    project = Project(
+        slug="site",
+        start_date=date(2023, 1, 1),
+        created_at=datetime(2015, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2015, 1, 1, tzinfo=UTC),
+    )
+    db.add(project)
+    await db.commit()
+
+    async def last_modified() -> str:
+        # Only the row timestamps, not the change clock
+        change_clock.clear()
+        await db.refresh(project)
+        return (await client.get("/api/v1/profile/projects/site")).headers["last-modified"]
+
+    assert await last_modified() == stale
+
+    project.translations.append(
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    )
+    await db.commit()
+    assert await last_modified() != stale
+
+    await db.execute(update(Project).values(updated_at=datetime(2015, 1, 1, tzinfo=UTC)))
+    await db.commit()
+    await db.refresh(project)
+    project.stacks.append(Stack(name="Python", updated_at=datetime(2015, 1, 1, tzinfo=UTC)))
+    await db.commit()
+    assert await last_modified() != stale
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_last_modified_does_not_move_back_after_delete(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    newest = Stack(name="Rust", updated_at=datetime(2016, 1, 1, tzinfo=UTC))
+    db.add_all([Stack(name="Python", updated_at=datetime(2015, 1, 1, tzinfo=UTC)), newest])
+    await db.commit()
+    change_clock.clear()
+
+    urls = ("/api/v1/profile/stacks", "/api/v1/profile/full?lang=en")
+    seen = {url: (await client.get(url)).headers["last-modified"] for url in urls}
+    assert seen["/api/v1/profile/stacks"] == "Fri, 01 Jan 2016 00:00:00 GMT"
+
+    await db.delete(newest)
+    await db.commit()
+
+    for url, last_modified in seen.items():
+        response = await client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 200
+        assert response.headers["last-modified"] != last_modified
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_last_modified_is_seeded_from_the_data(client: AsyncClient, db: AsyncSession) -> None:
+    db.add(Stack(name="Python", updated_at=datetime(2016, 1, 1, tzinfo=UTC)))
+    await db.commit()
+
+    urls = ("/api/v1/profile/stacks", "/api/v1/profile/resume", "/api/v1/profile/full?lang=en")
+    for _ in range(2):
+        # A restarted worker starts with an empty cache and change clock
+        invalidate_all()
+        change_clock.clear()
+        for url in urls:
+            response = await client.get(url)
+            assert response.headers["last-modified"] == "Fri, 01 Jan 2016 00:00:00 GMT"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_last_modified_follows_embedded_stack_edits(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    old = datetime(2015, 1, 1, tzinfo=UTC)
+    stack = Stack(name="Python", category="Backend", updated_at=old)
+    db.add(Project(slug="site", start_date=date(2023, 1, 1), updated_at=old, stacks=[stack]))
+    await db.commit()
+    change_clock.clear()
+
+    urls = ("/api/v1/profile/projects", "/api/v1/profile/projects/site")
+    seen = {url: (await client.get(url)).headers["last-modified"] for url in urls}
+    assert set(seen.values()) == {"Thu, 01 Jan 2015 00:00:00 GMT"}
+
+    stack.category = "Language"
+    await db.commit()
+
+    for url, last_modified in seen.items():
+        response = await client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 200
+        assert "Language" in response.text
+
+    # The stack's own timestamp moves Last-Modified even without the change clock
+    invalidate_all()
+    change_clock.clear()
+    for url, last_modified in seen.items():
+        response = await client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 200
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profile_etag_changes_with_content(client: AsyncClient, db: AsyncSession) -> None:
+    stack = Stack(name="Python")
+    db.add(stack)
+    await db.commit()
+
+    etag = (await client.get("/api/v1/profile/stacks")).headers["etag"]
+
+    stack.category = "Backend"
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/stacks", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()[0]["category"] == "Backend"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profile_serves_pre_encoded_body(client: AsyncClient, db: AsyncSession) -> None:
+    db.add(Stack(name="Python"))
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/full?lang=en")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    snapshot = profile_cache.get(("full", "en"))
+    assert snapshot is not None
+    assert response.content == snapshot.body
+    assert response.json()["stacks"][0]["name"] == "Python"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profile_serves_precompressed_variant(client: AsyncClient, db: AsyncSession) -> None:
+    db.add_all([Stack(name=f"Technology {index}", category="Backend") for index in range(20)])
+    await db.commit()
+
+    identity = await client.get("/api/v1/profile/stacks", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+
+    response = await client.get("/api/v1/profile/stacks", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == identity.content
+    assert response.headers["etag"] != identity.headers["etag"]
+
+    response = await client.get(
+        "/api/v1/profile/stacks",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_project_by_slug(client: AsyncClient, db: AsyncSession) -> None:
+    stack = Stack(name="FastAPI")
+    project = Project(slug="site", start_date=date(2024, 1, 1), stacks=[stack])
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site"),
+        ProjectTranslation(language_code="ru", title="Сайт", description="Личный сайт"),
+    ]
+    db.add(project)
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/projects/site?lang=ru")
+    assert response.status_code == 200
+    assert response.headers.get("cache-control") == EXPECTED_CACHE_CONTROL
+    payload = response.json()
+    assert payload["slug"] == "site"
+    assert payload["title"] == "Сайт"
+    assert payload["stacks"][0]["name"] == "FastAPI"
+
+    response = await client.get("/api/v1/profile/projects/site?lang=de")
+    assert response.json()["title"] == "Site"
+
+    response = await client.get(
+        "/api/v1/profile/projects/site?lang=de",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_translation_fallback_agrees_across_endpoints(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    project = Project(slug="site", start_date=date(2024, 1, 1))
+    project.translations = [
+        ProjectTranslation(language_code="ru", title="Сайт", description="Личный сайт"),
+        ProjectTranslation(language_code="de", title="Seite", description="Webseite"),
+    ]
+    db.add(project)
+    await db.commit()
+
+    detail = await client.get("/api/v1/profile/projects/site?lang=fr")
+    full = await client.get("/api/v1/profile/full?lang=fr")
+    listed = await client.get("/api/v1/profile/projects?lang=fr")
+    assert detail.json()["title"] == "Seite"
+    assert full.json()["projects"][0]["title"] == "Seite"
+    assert listed.json()[0]["translations"][0]["title"] == "Seite"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_project_by_unknown_slug(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/profile/projects/missing")
+    assert response.status_code == 404
+    assert profile_cache.get(("project", "missing", "en")) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_endpoints_filter_translations_by_lang(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    site = Project(slug="site", start_date=date(2024, 1, 1), is_featured=True)
+    site.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site"),
+        ProjectTranslation(language_code="ru", title="Сайт", description="Личный сайт"),
+    ]
+    tool = Project(slug="tool", start_date=date(2023, 1, 1))
+    tool.translations = [
+        ProjectTranslation(language_code="de", title="Werkzeug", description="Ein Werkzeug"),
+    ]
+    contact = Contact(type="email", value="me@example.com", is_visible=True)
+    contact.translations = [
+        ContactTranslation(language_code="en", label="Email"),
+        ContactTranslation(language_code="ru", label="Почта"),
+    ]
+    db.add_all([site, tool, contact])
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/projects")
+    assert [len(item["translations"]) for item in response.json()] == [2, 1]
+
+    response = await client.get("/api/v1/profile/projects?lang=ru")
+    assert [[t["title"] for t in item["translations"]] for item in response.json()] == [
+        ["Сайт"],
+        ["Werkzeug"],
+    ]
+
+    response = await client.get("/api/v1/profile/projects?lang=fr")
+    assert [[t["title"] for t in item["translations"]] for item in response.json()] == [
+        ["Site"],
+        ["Werkzeug"],
+    ]
+
+    response = await client.get("/api/v1/profile/contacts?lang=ru")
+    assert [t["label"] for t in response.json()[0]["translations"]] == ["Почта"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_full_profile_compact(client: AsyncClient, db: AsyncSession) -> None:
+    python, fastapi = Stack(name="Python"), Stack(name="FastAPI")
+    exp = WorkExperience(
+        company_name="Test Corp", start_date=date(2023, 1, 1), stacks=[python, fastapi]
+    )
+    exp.translations = [
+        WorkExperienceTranslation(language_code="en", position="Dev", description="Code")
+    ]
+    project = Project(slug="site", start_date=date(2024, 1, 1), stacks=[python])
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    db.add_all([exp, project])
+    await db.commit()
+
+    full = await client.get("/api/v1/profile/full?lang=en")
+    compact = await client.get("/api/v1/profile/full?lang=en&format=compact")
+    assert compact.status_code == 200
+    assert compact.headers["etag"] != full.headers["etag"]
+    assert len(compact.content) < len(full.content)
+
+    payload = compact.json()
+    assert [stack["name"] for stack in payload["stacks"]] == ["FastAPI", "Python"]
+    assert payload["experience"][0]["stacks"] == [0, 1]
+    assert payload["projects"][0]["stacks"] == [1]
+    assert payload["experience"][0]["start_date"] == "2023-01-01"
+    assert "end_date" not in payload["experience"][0]
+    assert "icon_url" not in payload["stacks"][0]
+
+    response = await client.get(
+        "/api/v1/profile/full?lang=en&format=compact",
+        headers={"If-None-Match": compact.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_endpoint_cursor_pagination(client: AsyncClient, db: AsyncSession) -> None:
+    db.add_all(
+        [
+            TestimonialModel(author_name=f"Author {day}", date=date(2024, 1, day))
+            for day in (1, 2, 2, 3, 4)
+        ]
+    )
+    await db.commit()
+
+    seen: list[str] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        url = "/api/v1/profile/testimonials?limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = await client.get(url)
+        assert response.status_code == 200
+        pages += 1
+        seen.extend(item["date"] for item in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == ["2024-01-04", "2024-01-03", "2024-01-02", "2024-01-02", "2024-01-01"]
+
+    response = await client.get("/api/v1/profile/testimonials?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_endpoint_field_selection(client: AsyncClient, db: AsyncSession) -> None:
+    project = Project(slug="site", start_date=date(2024, 1, 1), stacks=[Stack(name="Python")])
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    db.add(project)
+    await db.commit()
+    db.expunge_all()
+    # The change clock is seeded by the first build of the process, not per request
+    change_clock.seed(None)
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/profile/projects?fields=slug,translations&lang=en")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "slug": "site",
+            "translations": [
+                {
+                    "language_code": "en",
+                    "title": "Site",
+                    "description": "Personal site",
+                    "role": None,
+                }
+            ],
+        }
+    ]
+    assert len(statements) == 2
+    assert not any("project_stacks" in statement for statement in statements)
+    assert "repo_link" not in statements[0]
+
+    response = await client.get("/api/v1/profile/projects?fields=slug,secret")
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_stack_entries(client: AsyncClient, db: AsyncSession) -> None:
+    python, go = Stack(name="Python"), Stack(name="Go")
+    exp = WorkExperience(company_name="Test Corp", start_date=date(2023, 1, 1), stacks=[python])
+    exp.translations = [
+        WorkExperienceTranslation(language_code="ru", position="Разработчик", description="Код")
+    ]
+    site = Project(slug="site", start_date=date(2024, 1, 1), stacks=[python, go])
+    site.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    tool = Project(slug="tool", start_date=date(2022, 1, 1), stacks=[go])
+    tool.translations = [ProjectTranslation(language_code="en", title="Tool", description="CLI")]
+    db.add_all([exp, site, tool])
+    await db.commit()
+
+    response = await client.get("/api/v1/profile/stacks/Python?lang=ru")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["stack"]["name"] == "Python"
+    assert payload["usage"] == {
+        "project_count": 1,
+        "experience_count": 1,
+        "first_used": "2023-01-01",
+        "last_used": "2024-01-01",
+        "in_use": True,
+    }
+    assert [entry["position"] for entry in payload["experience"]] == ["Разработчик"]
+    assert [entry["slug"] for entry in payload["projects"]] == ["site"]
+    assert [stack["name"] for stack in payload["projects"][0]["stacks"]] == ["Go", "Python"]
+
+    response = await client.get("/api/v1/profile/stacks/Go")
+    assert response.json()["experience"] == []
+    assert [entry["slug"] for entry in response.json()["projects"]] == ["site", "tool"]
+
+    response = await client.get("/api/v1/profile/stacks/Rust")
+    assert response.status_code == 404
+
+
+@pytest.mark.unit
+def test_profile_reads_use_read_only_sessions() -> None:
+    for route in router.routes:
+        assert isinstance(route, APIRoute)
+        if "GET" not in route.methods:
+            continue
+        calls = {dependency.call for dependency in route.dependant.dependencies}
+        assert get_db not in calls, route.path
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_only_published_unpaginated_responses_are_cached(client: AsyncClient) -> None:
+    for params in ({"lang": "zz"}, {"limit": 1}, {"fields": "slug"}):
+        response = await client.get("/api/v1/profile/projects", params=params)
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+    await client.get("/api/v1/profile/full", params={"lang": "zz", "format": "compact"})
+    assert len(profile_cache) == 0
+
+    await client.get("/api/v1/profile/projects", params={"lang": "en"})
+    assert len(profile_cache) == 1
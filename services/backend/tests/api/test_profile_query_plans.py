@@ -0,0 +1,103 @@
+"""Guard the profile list queries against regressing to full scans plus sorts."""
+
+import json
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.profile import (
+    PROJECT_ORDER,
+    STACK_ORDER,
+    TESTIMONIAL_ORDER,
+    WORK_EXPERIENCE_ORDER,
+)
+from app.models.contact import Contact
+from app.models.project import Project, project_stacks
+from app.models.resume import Resume
+from app.models.stack import Stack
+from app.models.testimonial import Testimonial as TestimonialModel
+from app.models.work_experience import WorkExperience, work_experience_stacks
+
+STACK_ID = uuid.UUID(int=1)
+
+QUERIES: list[tuple[str, Select[Any], str]] = [
+    (
+        "experience",
+        WORK_EXPERIENCE_ORDER.paginate(select(WorkExperience), None, 20),
+        "ix_work_experiences_start_date_id",
+    ),
+    (
+        "projects",
+        PROJECT_ORDER.paginate(select(Project), None, 20),
+        "ix_projects_is_featured_start_date_id",
+    ),
+    ("stacks", STACK_ORDER.paginate(select(Stack), None, 20), "ix_stacks_name"),
+    (
+        "testimonials",
+        TESTIMONIAL_ORDER.paginate(select(TestimonialModel), None, 20),
+        "ix_testimonials_date_id",
+    ),
+    (
+        "contacts",
+        select(Contact).where(Contact.is_visible).order_by(Contact.sort_order),
+        "ix_contacts_is_visible_sort_order",
+    ),
+    (
+        "resume",
+        select(Resume).where(Resume.is_active).order_by(Resume.language_code),
+        "ix_resumes_is_active_language_code",
+    ),
+    (
+        "projects by stack",
+        select(project_stacks.c.project_id).where(project_stacks.c.stack_id == STACK_ID),
+        "ix_project_stacks_stack_id",
+    ),
+    (
+        "experience by stack",
+        select(work_experience_stacks.c.work_experience_id).where(
+            work_experience_stacks.c.stack_id == STACK_ID
+        ),
+        "ix_work_experience_stacks_stack_id",
+    ),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("name", "statement", "index"), QUERIES, ids=[q[0] for q in QUERIES])
+async def test_profile_query_uses_index(
+    db: AsyncSession, name: str, statement: Select[Any], index: str
+) -> None:
+    sql = statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = " | ".join(row.detail for row in await db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def _plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _plan_nodes(child)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(("name", "statement", "index"), QUERIES, ids=[q[0] for q in QUERIES])
+async def test_profile_query_uses_index_on_postgres(
+    db: AsyncSession, name: str, statement: Select[Any], index: str
+) -> None:
+    sql = statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    # Tables are empty here, so without these the planner would rightly prefer seq scans
+    # and sorts; a Sort left in the plan then means no index can produce the order
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    await db.execute(text("SET LOCAL enable_sort = off"))
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = list(_plan_nodes(plan[0]["Plan"]))
+
+    assert index in {node.get("Index Name") for node in nodes}
+    assert not any(node["Node Type"] in {"Sort", "Seq Scan"} for node in nodes)
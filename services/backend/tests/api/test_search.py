@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectTranslation
+from app.models.testimonial import Testimonial as TestimonialModel
+from app.models.testimonial import TestimonialTranslation
+from app.models.work_experience import WorkExperience, WorkExperienceTranslation
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_across_translated_content(client: AsyncClient, db: AsyncSession) -> None:
+    project = Project(slug="site", start_date=date(2024, 1, 1))
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Built with FastAPI"),
+        ProjectTranslation(language_code="ru", title="Сайт", description="Сделан на FastAPI"),
+    ]
+    exp = WorkExperience(company_name="Corp", start_date=date(2023, 1, 1))
+    exp.translations = [
+        WorkExperienceTranslation(
+            language_code="en", position="Backend developer", description="FastAPI services"
+        )
+    ]
+    testimonial = TestimonialModel(author_name="Jane", date=date(2024, 2, 2))
+    testimonial.translations = [
+        TestimonialTranslation(language_code="en", content="Great work on the site")
+    ]
+    db.add_all([project, exp, testimonial])
+    await db.commit()
+
+    response = await client.get("/api/v1/search?q=fastapi")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["lang"] == "en"
+    assert {(hit["kind"], hit["title"]) for hit in payload["hits"]} == {
+        ("project", "Site"),
+        ("experience", "Backend developer"),
+    }
+    project_hit = next(hit for hit in payload["hits"] if hit["kind"] == "project")
+    assert project_hit["slug"] == "site"
+    assert project_hit["snippet"] == "Built with <mark>FastAPI</mark>"
+
+    response = await client.get("/api/v1/search?q=сделан&lang=ru")
+    assert [hit["title"] for hit in response.json()["hits"]] == ["Сайт"]
+
+    response = await client.get("/api/v1/search?q=great%20site")
+    assert [hit["kind"] for hit in response.json()["hits"]] == ["testimonial"]
+
+    response = await client.get("/api/v1/search?q=")
+    assert response.status_code == 422
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_matches_every_search_vector_column(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    project = Project(slug="site", start_date=date(2024, 1, 1))
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Blog", role="Architect")
+    ]
+    exp = WorkExperience(company_name="Corp", start_date=date(2023, 1, 1))
+    exp.translations = [
+        WorkExperienceTranslation(
+            language_code="en", position="Developer", description="APIs", location="Lisbon"
+        )
+    ]
+    testimonial = TestimonialModel(author_name="Jane", date=date(2024, 2, 2))
+    testimonial.translations = [
+        TestimonialTranslation(language_code="en", content="Great work", author_position="CTO")
+    ]
+    db.add_all([project, exp, testimonial])
+    await db.commit()
+
+    async def kinds(query: str) -> list[str]:
+        response = await client.get("/api/v1/search", params={"q": query})
+        return [hit["kind"] for hit in response.json()["hits"]]
+
+    assert await kinds("architect") == ["project"]
+    assert await kinds("lisbon") == ["experience"]
+    assert await kinds("cto") == ["testimonial"]
+    # Author names are not in the testimonial search vectors
+    assert await kinds("jane") == []
@@ -0,0 +1,88 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.cli.export_snapshots import SNAPSHOT_VERSION, export_snapshots
+from app.models.project import Project, ProjectTranslation
+
+
+async def _add_project(db: AsyncSession, slug: str, title: str) -> Project:
+    project = Project(slug=slug, start_date=date(2024, 1, 1))
+    project.translations = [
+        ProjectTranslation(language_code="en", title=title, description="Description")
+    ]
+    db.add(project)
+    await db.commit()
+    return project
+
+
+@pytest.mark.unit
+async def test_export_writes_versioned_snapshots(db: AsyncSession, tmp_path: Path) -> None:
+    await _add_project(db, "site", "Site")
+
+    result = await export_snapshots(tmp_path, ["en", "ru"], async_sessionmaker(bind=db.bind))
+
+    assert result.written == [
+        "en/profile.json",
+        "en/projects/site.json",
+        "ru/profile.json",
+        "ru/projects/site.json",
+    ]
+    version_dir = tmp_path / f"v{SNAPSHOT_VERSION}"
+    profile = json.loads((version_dir / "en/profile.json").read_text())
+    assert profile["projects"][0]["title"] == "Site"
+    project = json.loads((version_dir / "ru/projects/site.json").read_text())
+    assert project["slug"] == "site"
+    manifest = json.loads((version_dir / "manifest.json").read_text())
+    assert manifest["version"] == SNAPSHOT_VERSION
+    assert set(manifest["files"]) == set(result.written)
+
+
+@pytest.mark.unit
+async def test_export_only_rewrites_changed_files(db: AsyncSession, tmp_path: Path) -> None:
+    site = await _add_project(db, "site", "Site")
+    await _add_project(db, "blog", "Blog")
+    session_factory = async_sessionmaker(bind=db.bind)
+    await export_snapshots(tmp_path, ["en"], session_factory)
+
+    result = await export_snapshots(tmp_path, ["en"], session_factory)
+    assert result.written == []
+    assert len(result.unchanged) == 3
+
+    await db.refresh(site, ["translations"])
+    site.translations[0].title = "Site v2"
+    await db.commit()
+    result = await export_snapshots(tmp_path, ["en"], session_factory)
+    assert result.written == ["en/profile.json", "en/projects/site.json"]
+    assert result.unchanged == ["en/projects/blog.json"]
+
+    await db.delete(site)
+    await db.commit()
+    result = await export_snapshots(tmp_path, ["en"], session_factory)
+    assert result.removed == ["en/projects/site.json"]
+    assert not (tmp_path / f"v{SNAPSHOT_VERSION}/en/projects/site.json").exists()
+
+
+@pytest.mark.unit
+async def test_export_of_one_language_keeps_the_others(db: AsyncSession, tmp_path: Path) -> None:
+    await _add_project(db, "site", "Site")
+    session_factory = async_sessionmaker(bind=db.bind)
+    await export_snapshots(tmp_path, ["en", "ru"], session_factory)
+    await _add_project(db, "blog", "Blog")
+
+    result = await export_snapshots(tmp_path, ["en"], session_factory)
+    assert result.written == ["en/profile.json", "en/projects/blog.json"]
+    assert result.removed == []
+    version_dir = tmp_path / f"v{SNAPSHOT_VERSION}"
+    assert (version_dir / "ru/projects/site.json").exists()
+    manifest = json.loads((version_dir / "manifest.json").read_text())
+    assert set(manifest["files"]) == {
+        "en/profile.json",
+        "en/projects/blog.json",
+        "en/projects/site.json",
+        "ru/profile.json",
+        "ru/projects/site.json",
+    }
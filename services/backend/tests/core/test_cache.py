@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import SnapshotCache, invalidate_all
+
+
+@pytest.mark.unit
+async def test_concurrent_misses_share_one_build() -> None:
+    cache: SnapshotCache[int] = SnapshotCache()
+    builds = 0
+
+    async def build() -> int:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_build("en", build) for _ in range(10)))
+    assert results == [42] * 10
+    assert builds == 1
+
+
+@pytest.mark.unit
+async def test_build_locks_are_released_once_no_caller_waits() -> None:
+    cache: SnapshotCache[int] = SnapshotCache()
+
+    async def build() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    async def fail() -> int:
+        raise RuntimeError("boom")
+
+    await asyncio.gather(*(cache.get_or_build(key, build) for key in ("en", "ru", "en")))
+    with pytest.raises(RuntimeError):
+        await cache.get_or_build("de", fail)
+    assert cache._locks == {}
+
+
+@pytest.mark.unit
+async def test_build_in_flight_during_invalidation_is_not_stored() -> None:
+    cache: SnapshotCache[str] = SnapshotCache()
+
+    async def build() -> str:
+        invalidate_all()
+        return "stale"
+
+    assert await cache.get_or_build("en", build) == "stale"
+    assert cache.get("en") is None
+
+
+@pytest.mark.unit
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: SnapshotCache[int] = SnapshotCache(max_entries=2)
+    cache.set("en", 1)
+    cache.set("ru", 2)
+    assert cache.get("en") == 1
+    cache.set("de", 3)
+    assert cache.get("ru") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_expired_entry_is_dropped() -> None:
+    cache: SnapshotCache[int] = SnapshotCache(ttl=0)
+    cache.set("en", 1)
+    assert cache.get("en") is None
+
+
+@pytest.mark.unit
+def test_cache_can_opt_out_of_content_invalidation() -> None:
+    content: SnapshotCache[int] = SnapshotCache()
+    probes: SnapshotCache[int] = SnapshotCache(invalidate_on_change=False)
+    content.set("en", 1)
+    probes.set("migrations", 1)
+    invalidate_all()
+    assert content.get("en") is None
+    assert probes.get("migrations") == 1
@@ -0,0 +1,47 @@
+import gzip
+
+import pytest
+
+from app.core.compression import MIN_COMPRESS_SIZE, compress_variants, negotiate_encoding
+
+AVAILABLE = ("zstd", "br", "gzip")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br, zstd;q=0", "br"),
+        ("*", "zstd"),
+        ("*;q=0.1, gzip;q=0.5", "gzip"),
+        ("GZIP", "gzip"),
+    ],
+)
+def test_negotiate_encoding(header: str | None, expected: str | None) -> None:
+    assert negotiate_encoding(header, AVAILABLE) == expected
+
+
+@pytest.mark.unit
+def test_negotiate_encoding_only_offers_available_codings() -> None:
+    assert negotiate_encoding("br, zstd", ("gzip",)) is None
+
+
+@pytest.mark.unit
+def test_small_bodies_are_not_compressed() -> None:
+    assert compress_variants(b"x" * (MIN_COMPRESS_SIZE - 1)) == {}
+
+
+@pytest.mark.unit
+def test_compress_variants_round_trip() -> None:
+    body = b'{"name": "Python"}' * 100
+    variants = compress_variants(body)
+
+    assert "gzip" in variants
+    assert gzip.decompress(variants["gzip"]) == body
+    assert all(len(compressed) < len(body) for compressed in variants.values())
@@ -0,0 +1,49 @@
+from collections.abc import Iterator
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.events import ContentChanged, publish, subscribe, unsubscribe
+from app.models.project import Project
+
+
+@pytest.fixture
+def received() -> Iterator[list[ContentChanged]]:
+    events: list[ContentChanged] = []
+    handler = subscribe(events.append)
+    yield events
+    unsubscribe(handler)
+
+
+@pytest.mark.unit
+async def test_commit_publishes_changed_tables(
+    db: AsyncSession, received: list[ContentChanged]
+) -> None:
+    db.add(Project(slug="proj", start_date=date(2024, 1, 1)))
+    await db.commit()
+
+    assert received == [ContentChanged(source="session", tables=frozenset({"projects"}))]
+
+
+@pytest.mark.unit
+async def test_rollback_publishes_nothing(db: AsyncSession, received: list[ContentChanged]) -> None:
+    db.add(Project(slug="proj", start_date=date(2024, 1, 1)))
+    await db.flush()
+    await db.rollback()
+
+    assert received == []
+
+
+@pytest.mark.unit
+def test_failing_subscriber_does_not_block_others(received: list[ContentChanged]) -> None:
+    def broken(change: ContentChanged) -> None:
+        raise RuntimeError("boom")
+
+    subscribe(broken)
+    try:
+        publish(ContentChanged(source="test"))
+    finally:
+        unsubscribe(broken)
+
+    assert received == [ContentChanged(source="test")]
@@ -0,0 +1,42 @@
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.pagination import InvalidCursorError, Keyset
+from app.models.project import Project
+
+PROJECT_ORDER = Keyset((Project.is_featured, Project.start_date, Project.id), descending=True)
+
+
+@pytest.mark.unit
+def test_cursor_round_trips_typed_sort_values() -> None:
+    row = SimpleNamespace(is_featured=True, start_date=date(2024, 5, 1), id=uuid.uuid4())
+
+    cursor = PROJECT_ORDER.encode(row)
+
+    assert "=" not in cursor
+    assert PROJECT_ORDER.decode(cursor) == (row.is_featured, row.start_date, row.id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["", "%%%", "WzFd"])
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        PROJECT_ORDER.decode(cursor)
+
+
+@pytest.mark.unit
+def test_page_reports_next_cursor_only_when_rows_remain() -> None:
+    rows = [
+        SimpleNamespace(is_featured=False, start_date=date(2024, 1, day), id=uuid.uuid4())
+        for day in (3, 2, 1)
+    ]
+
+    page, cursor = PROJECT_ORDER.page(rows, 2)
+    assert page == rows[:2]
+    assert PROJECT_ORDER.decode(cursor or "")[2] == rows[1].id
+
+    assert PROJECT_ORDER.page(rows, 3) == (rows, None)
+    assert PROJECT_ORDER.page(rows, None) == (rows, None)
@@ -0,0 +1,141 @@
+import asyncio
+import inspect
+from pathlib import Path
+
+import aiosqlite
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.pool import MeteredPool, check_liveness, open_connections, pool_status
+
+
+@pytest.fixture
+async def engine(tmp_path: Path):  # type: ignore[no-untyped-def]
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredPool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    yield engine
+    await engine.dispose()
+
+
+def _pool(engine: AsyncEngine) -> MeteredPool:
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, MeteredPool)
+    return pool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_checkouts_overflow_and_timeouts_are_counted(engine: AsyncEngine) -> None:
+    async with engine.connect() as first, engine.connect() as second:
+        await first.exec_driver_sql("SELECT 1")
+        await second.exec_driver_sql("SELECT 1")
+        status = pool_status(engine)
+        assert (status["checked_out"], status["overflow"]) == (2, 1)
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+
+    metrics = _pool(engine).metrics
+    assert (metrics.checkouts, metrics.connects, metrics.timeouts) == (2, 2, 1)
+    assert metrics.peak_overflow == 1
+    assert metrics.wait_max_seconds >= 0.01
+    assert metrics.checkout_max_seconds > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replaced_connections_count_as_recycled(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SELECT 1")
+        await connection.invalidate()
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SELECT 1")
+
+    metrics = _pool(engine).metrics
+    assert (metrics.connects, metrics.recycles, metrics.invalidations) == (2, 1, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_metrics_survive_dispose(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SELECT 1")
+    metrics = _pool(engine).metrics
+
+    await engine.dispose()
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SELECT 1")
+
+    assert _pool(engine).metrics is metrics
+    assert (metrics.checkouts, metrics.connects) == (2, 2)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_liveness_check_survives_pool_timeouts(engine: AsyncEngine) -> None:
+    metrics = _pool(engine).metrics
+    task = asyncio.create_task(check_liveness(engine, 0.01))
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.exec_driver_sql("SELECT 1")
+            await second.exec_driver_sql("SELECT 1")
+            await asyncio.sleep(0.1)
+            assert not task.done()
+            assert metrics.alive is False
+
+        await asyncio.sleep(0.1)
+        assert not task.done()
+        assert metrics.alive is True
+    finally:
+        task.cancel()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_open_connections_leaves_them_idle(engine: AsyncEngine) -> None:
+    await open_connections(engine, 2)
+
+    status = pool_status(engine)
+    assert (status["checked_out"], status["idle"], status["connects"]) == (0, 1, 2)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_open_connections_closes_the_others_when_one_fails(tmp_path: Path) -> None:
+    attempts = 0
+
+    async def connect() -> aiosqlite.Connection:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OSError("connection refused")
+        await asyncio.sleep(0.05)
+        return await aiosqlite.connect(tmp_path / "pool.db")
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", async_creator=connect, poolclass=MeteredPool, pool_size=3
+    )
+    try:
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await open_connections(engine, 3)
+        await asyncio.sleep(0.1)
+
+        assert excinfo.group_contains(OSError)
+        assert pool_status(engine)["checked_out"] == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.unit
+def test_pool_internals_metered_pool_relies_on() -> None:
+    """Fails when a SQLAlchemy upgrade drops the private hooks MeteredPool overrides."""
+    assert "_dispatch" in inspect.signature(Pool.__init__).parameters
+    assert "_dispatch" in inspect.getsource(QueuePool.recreate)
+    assert callable(getattr(AsyncAdaptedQueuePool, "_do_get", None))
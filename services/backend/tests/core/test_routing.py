@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.core.routing import ReplicaRouter, RoutingSessionMaker
+
+
+def _sqlite(path: Path) -> AsyncEngine:
+    return create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+
+@pytest.fixture
+async def engines(tmp_path: Path):  # type: ignore[no-untyped-def]
+    primary, first, second = (_sqlite(tmp_path / f"{name}.db") for name in "pab")
+    # The directory does not exist, so connecting fails
+    unreachable = _sqlite(tmp_path / "missing" / "c.db")
+    for name, engine in (("primary", primary), ("first", first), ("second", second)):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE node (name TEXT)"))
+            await conn.execute(text("INSERT INTO node VALUES (:name)"), {"name": name})
+    yield primary, first, second, unreachable
+    for engine in (primary, first, second, unreachable):
+        await engine.dispose()
+
+
+async def _node(session: AsyncSession) -> str:
+    async with session:
+        return (await session.execute(text("SELECT name FROM node"))).scalar_one()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sessions_round_robin_over_replicas(engines) -> None:  # type: ignore[no-untyped-def]
+    primary, first, second, _ = engines
+    sessions = RoutingSessionMaker(ReplicaRouter(primary, [first, second]))
+
+    nodes = [await _node(sessions()) for _ in range(4)]
+
+    assert nodes == ["first", "second", "first", "second"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_without_replicas_reads_go_to_primary(engines) -> None:  # type: ignore[no-untyped-def]
+    primary, *_ = engines
+    sessions = RoutingSessionMaker(ReplicaRouter(primary, []))
+
+    assert await _node(sessions()) == "primary"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unreachable_replica_fails_over_and_cools_down(
+    engines, monkeypatch: pytest.MonkeyPatch
+) -> None:  # type: ignore[no-untyped-def]
+    primary, first, _, unreachable = engines
+    now = 1000.0
+    monkeypatch.setattr("app.core.routing.time.monotonic", lambda: now)
+    router = ReplicaRouter(primary, [unreachable, first], cooldown=60)
+    sessions = RoutingSessionMaker(router)
+    session = sessions()
+    assert session.bind is unreachable
+
+    assert await _node(session) == "first"
+    # Out of rotation now: only the healthy replica and the primary remain
+    assert router.candidates() == [first, primary]
+
+    now += 61
+    assert set(router.candidates()) == {unreachable, first, primary}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_all_replicas_down_falls_back_to_primary(engines) -> None:  # type: ignore[no-untyped-def]
+    primary, _, _, unreachable = engines
+    sessions = RoutingSessionMaker(ReplicaRouter(primary, [unreachable]))
+
+    assert await _node(sessions()) == "primary"
+    assert sessions.router.candidates() == [primary]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sessions_connect_lazily(engines) -> None:  # type: ignore[no-untyped-def]
+    primary, first, _, unreachable = engines
+    router = ReplicaRouter(primary, [unreachable, first])
+    sessions = RoutingSessionMaker(router)
+
+    # A session that runs no query never connects, so the bad replica goes unnoticed
+    async with sessions() as session:
+        assert session.bind is unreachable
+
+    assert len(router.candidates()) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reads_pinned_to_primary_after_writes(engines) -> None:  # type: ignore[no-untyped-def]
+    primary, first, second, _ = engines
+    router = ReplicaRouter(primary, [first, second], primary_window=60)
+    sessions = RoutingSessionMaker(router)
+
+    router.pin_to_primary()
+
+    assert [await _node(sessions()) for _ in range(2)] == ["primary", "primary"]
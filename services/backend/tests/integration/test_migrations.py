@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.integration
+def test_models_match_migrations_at_head(test_database_url: str) -> None:
+    """Autogenerate finds nothing to change in a database migrated to head."""
+    env = {**os.environ, "DATABASE_URL": test_database_url}
+
+    def alembic(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "alembic", *args],
+            cwd=BACKEND_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    upgrade = alembic("upgrade", "head")
+    assert upgrade.returncode == 0, upgrade.stderr
+    try:
+        check = alembic("check")
+        assert check.returncode == 0, check.stderr
+    finally:
+        alembic("downgrade", "base")
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.stack import Stack, StackUsage
+from app.models.work_experience import WorkExperience
+
+
+async def _usage(db: AsyncSession) -> dict[str, tuple[int, int, date | None, date | None, bool]]:
+    result = await db.execute(
+        select(Stack.name, StackUsage).join(StackUsage, StackUsage.stack_id == Stack.id)
+    )
+    return {
+        name: (
+            usage.project_count,
+            usage.experience_count,
+            usage.first_used,
+            usage.last_used,
+            usage.in_use,
+        )
+        for name, usage in result.tuples()
+    }
+
+
+@pytest.mark.unit
+async def test_usage_follows_association_changes(db: AsyncSession) -> None:
+    python, go = Stack(name="Python"), Stack(name="Go")
+    db.add_all([python, go])
+    await db.commit()
+    assert await _usage(db) == {
+        "Python": (0, 0, None, None, False),
+        "Go": (0, 0, None, None, False),
+    }
+
+    job = WorkExperience(
+        company_name="Corp",
+        start_date=date(2019, 1, 1),
+        end_date=date(2021, 6, 30),
+        stacks=[python],
+    )
+    site = Project(slug="site", start_date=date(2022, 3, 1), stacks=[python, go])
+    db.add_all([job, site])
+    await db.commit()
+    db.expire_all()
+    assert await _usage(db) == {
+        "Python": (1, 1, date(2019, 1, 1), date(2022, 3, 1), True),
+        "Go": (1, 0, date(2022, 3, 1), date(2022, 3, 1), True),
+    }
+
+    await db.refresh(site, ["stacks"])
+    site.stacks.remove(go)
+    site.end_date = date(2023, 1, 1)
+    await db.commit()
+    db.expire_all()
+    assert await _usage(db) == {
+        "Python": (1, 1, date(2019, 1, 1), date(2023, 1, 1), False),
+        "Go": (0, 0, None, None, False),
+    }
+
+    await db.delete(job)
+    await db.delete(go)
+    await db.commit()
+    db.expire_all()
+    assert await _usage(db) == {"Python": (1, 0, date(2022, 3, 1), date(2023, 1, 1), False)}
+
+
+@pytest.mark.unit
+async def test_unrelated_changes_do_not_touch_usage(db: AsyncSession) -> None:
+    site = Project(slug="site", start_date=date(2022, 3, 1), stacks=[Stack(name="Python")])
+    db.add(site)
+    await db.commit()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await db.refresh(site)
+        site.link = "https://example.com"
+        await db.commit()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert not any("stack_usage" in statement for statement in statements)
+
+
+@pytest.mark.unit
+def test_listener_is_registered_with_the_models() -> None:
+    """Scripts that use the models without importing app.main keep usage in sync too."""
+    check = (
+        "import sys\n"
+        "from sqlalchemy import event\n"
+        "from sqlalchemy.orm import Session\n"
+        "import app.models\n"
+        "from app.models.stack_usage import _refresh_after_flush\n"
+        "assert not any(name.startswith(('app.main', 'app.services')) for name in sys.modules)\n"
+        "assert event.contains(Session, 'after_flush', _refresh_after_flush)\n"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True)
@@ -0,0 +1,163 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import Base
+from app.models.contact import Contact, ContactTranslation
+from app.models.project import Project, ProjectTranslation
+from app.models.resume import Resume
+from app.models.stack import Stack
+from app.models.testimonial import Testimonial as TestimonialModel
+from app.models.testimonial import TestimonialTranslation
+from app.models.work_experience import WorkExperience, WorkExperienceTranslation
+from app.services.profile import load_full_profile_orm
+from app.services.profile_aggregate import fetch_full_profile
+
+
+async def _seed(db: AsyncSession) -> None:
+    python, fastapi, docker = Stack(name="Python"), Stack(name="FastAPI"), Stack(name="Docker")
+    db.add_all([python, fastapi, docker])
+
+    current = WorkExperience(
+        company_name="Current Corp",
+        start_date=date(2023, 1, 1),
+        is_current=True,
+        stacks=[python, fastapi],
+    )
+    current.translations = [
+        WorkExperienceTranslation(language_code="en", position="Lead", description="Leads"),
+        WorkExperienceTranslation(language_code="ru", position="Лид", description="Руководит"),
+    ]
+    previous = WorkExperience(
+        company_name="Old Corp",
+        start_date=date(2020, 1, 1),
+        end_date=date(2022, 12, 31),
+        stacks=[docker],
+    )
+    previous.translations = [
+        WorkExperienceTranslation(language_code="de", position="Entwickler", description="Code"),
+    ]
+    untranslated = WorkExperience(company_name="Silent Corp", start_date=date(2019, 1, 1))
+    db.add_all([current, previous, untranslated])
+
+    featured = Project(slug="featured", start_date=date(2021, 1, 1), is_featured=True)
+    featured.translations = [
+        ProjectTranslation(language_code="en", title="Featured", description="Main project")
+    ]
+    featured.stacks = [python]
+    recent = Project(slug="recent", start_date=date(2024, 1, 1))
+    recent.translations = [
+        ProjectTranslation(language_code="ru", title="Недавний", description="Проект", role="Dev")
+    ]
+    db.add_all([featured, recent])
+
+    testimonial = TestimonialModel(author_name="Jane", date=date(2024, 2, 2), kind="client")
+    testimonial.translations = [
+        TestimonialTranslation(language_code="en", content="Great", author_position="CTO")
+    ]
+    db.add(testimonial)
+
+    visible = Contact(type="email", value="me@example.com", sort_order=1)
+    visible.translations = [ContactTranslation(language_code="ru", label="Почта")]
+    hidden = Contact(type="phone", value="+1", is_visible=False)
+    db.add_all([visible, hidden])
+
+    db.add_all(
+        [
+            Resume(language_code="ru", file_path="/cv_ru.pdf"),
+            Resume(language_code="en", file_path="/cv_en.pdf"),
+            Resume(language_code="de", file_path="/cv_de.pdf", is_active=False),
+        ]
+    )
+    await db.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("lang", ["en", "ru", "fr"])
+async def test_aggregate_matches_orm_loader(db: AsyncSession, lang: str) -> None:
+    await _seed(db)
+
+    aggregate, aggregate_modified = await fetch_full_profile(db, lang)
+    orm, orm_modified = await load_full_profile_orm(
+        db, async_sessionmaker(bind=db.bind), lang, concurrent=False
+    )
+
+    assert aggregate == orm
+    assert aggregate_modified == orm_modified
+
+
+@pytest.mark.unit
+async def test_aggregate_resolves_translation_fallback(db: AsyncSession) -> None:
+    await _seed(db)
+
+    profile, _ = await fetch_full_profile(db, "ru")
+
+    assert [entry.position for entry in profile.experience] == ["Лид", "Entwickler", ""]
+    assert [stack.name for stack in profile.experience[0].stacks] == ["FastAPI", "Python"]
+    assert [entry.title for entry in profile.projects] == ["Featured", "Недавний"]
+    assert [contact.label for contact in profile.contacts] == ["Почта"]
+    assert [resume.language_code for resume in profile.resumes] == ["en", "ru"]
+
+
+@pytest.mark.unit
+async def test_aggregate_is_a_single_statement(db: AsyncSession) -> None:
+    await _seed(db)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await fetch_full_profile(db, "en")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+
+
+@pytest.mark.unit
+async def test_orm_loader_runs_sections_on_separate_sessions(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}", poolclass=NullPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    connections: list[object] = []
+    event.listen(engine.sync_engine, "connect", lambda dbapi_conn, record: connections.append(1))
+    try:
+        async with session_factory() as db:
+            await _seed(db)
+            connections.clear()
+            concurrent, _ = await load_full_profile_orm(db, session_factory, "ru", concurrent=True)
+            opened = len(connections)
+            aggregate, _ = await fetch_full_profile(db, "ru")
+    finally:
+        await engine.dispose()
+
+    assert concurrent == aggregate
+    assert opened == 6
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("loader", ["aggregate", "orm"])
+async def test_stacks_are_validated_once_and_shared(db: AsyncSession, loader: str) -> None:
+    await _seed(db)
+
+    if loader == "aggregate":
+        profile, _ = await fetch_full_profile(db, "en")
+    else:
+        profile, _ = await load_full_profile_orm(
+            db, async_sessionmaker(bind=db.bind), "en", concurrent=False
+        )
+
+    by_name = {stack.name: stack for stack in profile.stacks}
+    python = by_name["Python"]
+    assert profile.experience[0].stacks[1] is python
+    assert profile.projects[0].stacks[0] is python
@@ -0,0 +1,72 @@
+import importlib.util
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.search import (
+    SEARCHABLE,
+    InMemorySearchIndex,
+    SearchDocument,
+    build_search_statement,
+    render_snippet,
+)
+
+
+def _document(title: str, text: str) -> SearchDocument:
+    return SearchDocument("project", uuid.uuid4(), None, title, text, (title, text))
+
+
+@pytest.mark.unit
+def test_index_requires_every_word_and_ranks_by_frequency() -> None:
+    index = InMemorySearchIndex(
+        [
+            _document("Parser", "A fast parser for config files"),
+            _document("Crawler", "Async crawler; the parser parses HTML, the parser is fast"),
+            _document("Bot", "Telegram bot"),
+        ]
+    )
+
+    assert [hit.title for hit in index.search("parser", 10)] == ["Crawler", "Parser"]
+    assert [hit.title for hit in index.search("fast config", 10)] == ["Parser"]
+    assert index.search("parser telegram", 10) == []
+    assert [hit.title for hit in index.search("pars", 1)] == ["Crawler"]
+
+
+@pytest.mark.unit
+def test_index_snippet_is_escaped_and_highlighted() -> None:
+    index = InMemorySearchIndex([_document("Site", "Rendered <b>server-side</b> with Astro")])
+
+    (hit,) = index.search("astro", 10)
+
+    assert hit.snippet == "Rendered &lt;b&gt;server-side&lt;/b&gt; with <mark>Astro</mark>"
+
+
+@pytest.mark.unit
+def test_render_snippet_converts_headline_delimiters() -> None:
+    assert render_snippet("a \x02<x>\x03 b") == "a <mark>&lt;x&gt;</mark> b"
+
+
+@pytest.mark.unit
+def test_postgres_statement_uses_search_vectors() -> None:
+    sql = str(build_search_statement("fast parser", "ru", 5).compile(dialect=postgresql.dialect()))
+
+    assert "websearch_to_tsquery" in sql
+    assert "project_translations.search_vector @@" in sql
+    assert "testimonial_translations.search_vector @@" in sql
+    assert "ts_headline" in sql
+
+
+@pytest.mark.unit
+def test_in_memory_index_covers_the_search_vector_columns() -> None:
+    path = Path(__file__).parents[2] / "alembic/versions/e2a4c6b8d0f3_translation_search_vectors.py"
+    spec = importlib.util.spec_from_file_location("search_vectors_migration", path)
+    assert spec and spec.loader
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.SEARCHABLE == {
+        model.__tablename__: tuple(column.key for column in columns)
+        for model, columns in SEARCHABLE.items()
+    }
@@ -0,0 +1,23 @@
+import pytest
+
+from app.models.project import ProjectTranslation
+from app.services.profile import TranslationIndex
+
+
+def _translation(language_code: str) -> ProjectTranslation:
+    return ProjectTranslation(language_code=language_code, title=language_code, description="")
+
+
+@pytest.mark.unit
+def test_translation_index_falls_back_to_english_then_first() -> None:
+    index = TranslationIndex([_translation("de"), _translation("en"), _translation("ru")])
+    assert index.get("ru").title == "ru"
+    assert index.get("fr").title == "en"
+
+    index = TranslationIndex([_translation("ru"), _translation("de")])
+    assert index.get("fr").title == "de"
+
+
+@pytest.mark.unit
+def test_translation_index_empty() -> None:
+    assert TranslationIndex([]).get("en") is None
@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.profile import profile_cache
+from app.main import app
+from app.models.project import Project, ProjectTranslation
+from app.services.warmup import WARM_UP_REQUESTS, warm_up, warm_up_state
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_warm_up_fills_profile_caches(client: AsyncClient, db: AsyncSession) -> None:
+    project = Project(slug="site", start_date=date(2024, 1, 1))
+    project.translations = [
+        ProjectTranslation(language_code="en", title="Site", description="Personal site")
+    ]
+    db.add(project)
+    await db.commit()
+
+    state = await warm_up(app, ["en", "ru"])
+
+    assert state is warm_up_state
+    assert state.completed and state.failures == []
+    # Language-independent endpoints are requested once
+    assert len(profile_cache) == 2 * len(WARM_UP_REQUESTS) - 2
+    response = await client.get("/api/v1/profile/projects", params={"lang": "ru"})
+    assert response.json()[0]["slug"] == "site"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_warm_up_records_failures(client: AsyncClient) -> None:
+    state = await warm_up(app, ["x"])
+
+    assert not state.completed
+    assert any("lang=x" in failure for failure in state.failures)